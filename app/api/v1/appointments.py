@@ -1,7 +1,9 @@
 from urllib.parse import unquote
 
-from fastapi import APIRouter, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+from psycopg2.extensions import connection as Connection
 
+from app.dependencies import get_conn
 from app.models.enum.response_status import ResponseStatus
 from app.exceptions import AppointmentException
 from app.exceptions.database.database_connection_exception import DatabaseConnectionException
@@ -19,6 +21,9 @@ from app.services.appointments_service import appointment_service
 # Initialize the router
 router = APIRouter(prefix="/appointments")
 
+# Handlers are plain functions: AppointmentService uses blocking psycopg2, so
+# FastAPI runs them in its threadpool instead of on the event loop.
+
 
 @router.post(
     "",
@@ -30,7 +35,10 @@ router = APIRouter(prefix="/appointments")
     },
     response_model=CreateAppointmentResponse
 )
-async def create_appointment(appointment: AppointmentRequestModel):
+def create_appointment(
+        appointment: AppointmentRequestModel,
+        conn: Connection = Depends(get_conn)
+):
     """
     Create a new appointment.
 
@@ -48,7 +56,7 @@ async def create_appointment(appointment: AppointmentRequestModel):
         customer_data = appointment.model_dump(exclude_none=True)
 
         # Create the appointment
-        appointment_id = appointment_service.create_appointment(customer_data)
+        appointment_id = appointment_service.create_appointment(conn, customer_data)
         return CreateAppointmentResponse(
             appointment_id=appointment_id,
             data=customer_data,
@@ -75,8 +83,9 @@ async def create_appointment(appointment: AppointmentRequestModel):
     },
     response_model=GetAppointmentByPhoneNumberResponse
 )
-async def get_appointment_by_phone_number(
-    phone_number: str = Query(..., description="Customer phone number")
+def get_appointment_by_phone_number(
+    phone_number: str = Query(..., description="Customer phone number"),
+    conn: Connection = Depends(get_conn)
 ):
     """
     Get an appointment by phone number.
@@ -95,7 +104,7 @@ async def get_appointment_by_phone_number(
         decoded_phone = unquote(phone_number)
 
         # Get contact info from vector store
-        appointment_data = appointment_service.get_appointment_by_phone_number(decoded_phone)
+        appointment_data = appointment_service.get_appointment_by_phone_number(conn, decoded_phone)
 
         # Prepare the payload
         appointment_id = appointment_data['id']
@@ -127,7 +136,10 @@ async def get_appointment_by_phone_number(
     },
     response_model=UpdateAppointmentResponse
 )
-async def update_appointment(appointment: AppointmentUpdateModel):
+def update_appointment(
+        appointment: AppointmentUpdateModel,
+        conn: Connection = Depends(get_conn)
+):
     """
     Update an existing appointment.
     
@@ -146,7 +158,7 @@ async def update_appointment(appointment: AppointmentUpdateModel):
         customer_data = appointment.model_dump(exclude_none=True)
 
         # Update the appointment
-        updated = appointment_service.update_appointment(customer_data)
+        updated = appointment_service.update_appointment(conn, customer_data)
         response_status = ResponseStatus.SUCCESS if updated else ResponseStatus.FAILED
 
         return UpdateAppointmentResponse(
@@ -176,8 +188,9 @@ async def update_appointment(appointment: AppointmentUpdateModel):
     },
     response_model=DeleteAppointmentResponse
 )
-async def delete_appointment_by_phone_number(
-        phone_number: str = Query(..., description="Customer phone number")
+def delete_appointment_by_phone_number(
+        phone_number: str = Query(..., description="Customer phone number"),
+        conn: Connection = Depends(get_conn)
 ):
     """
     Delete an appointment by phone number.
@@ -196,7 +209,7 @@ async def delete_appointment_by_phone_number(
         decoded_phone = unquote(phone_number)
 
         # Get contact info from vector store
-        success = appointment_service.delete_appointment_by_phone_number(decoded_phone)
+        success = appointment_service.delete_appointment_by_phone_number(conn, decoded_phone)
         response_status = ResponseStatus.SUCCESS if success else ResponseStatus.FAILED
 
         return DeleteAppointmentResponse(
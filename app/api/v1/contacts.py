@@ -1,5 +1,7 @@
+import itertools
 from urllib.parse import unquote
-from fastapi import APIRouter, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+from fastapi.responses import StreamingResponse
 import logging
 
 from app.models.contact_model import (
@@ -9,21 +11,25 @@ from app.models.contact_model import (
     ContactResponse,
     GetContactResponse,
     ContactListResponse,
+    BulkStatusResponse,
     StatusResponse
 )
 from app.services.contact_service import (
     ContactInfoService,
     ContactNotFoundException,  
-    ContactAlreadyExistsException
+    ContactAlreadyExistsException,
+    get_contact_service
 )
 from app.exceptions.database.database_connection_exception import DatabaseConnectionException
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/contacts")
 
-contact_service = ContactInfoService()
+# Handlers are plain functions: ContactInfoService uses blocking psycopg2, so
+# FastAPI runs them in its threadpool instead of on the event loop.
+# The service is created lazily on the first request through get_contact_service.
 
 
 @router.post(
@@ -36,7 +42,10 @@ contact_service = ContactInfoService()
         500: {"description": "Internal server error"}
     }
 )
-async def save_contact(contact: SaveContactRequest):
+def save_contact(
+    contact: SaveContactRequest,
+    contact_service: ContactInfoService = Depends(get_contact_service)
+):
     """
     Create or update a contact.
 
@@ -76,6 +85,50 @@ async def save_contact(contact: SaveContactRequest):
         )
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkStatusResponse,
+    responses={
+        422: {"description": "Invalid contact data"},
+        500: {"description": "Internal server error"}
+    }
+)
+def save_contacts_bulk(
+    contacts: List[SaveContactRequest],
+    contact_service: ContactInfoService = Depends(get_contact_service)
+):
+    """
+    Create or update many contacts in a single batch.
+
+    Args:
+        contacts: The contacts to save, including customer name and phone number
+
+    Returns:
+        BulkStatusResponse: The created/updated contact IDs and success message
+
+    Raises:
+        HTTPException: If data is invalid or an error occurs
+    """
+    try:
+        contact_ids = contact_service.save_contacts_bulk([
+            (contact.customer_name, contact.contact_number, contact.date)
+            for contact in contacts
+        ])
+
+        return BulkStatusResponse(
+            status="success",
+            message=f"{len(contact_ids)} contacts saved successfully",
+            ids=contact_ids
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"detail": f"Failed to save contacts: {str(e)}"}
+        )
+
+
 @router.get(
     "",
     response_model=GetContactResponse,
@@ -85,8 +138,9 @@ async def save_contact(contact: SaveContactRequest):
         500: {"description": "Internal server error"}
     }
 )
-async def get_contact(
-    phone_number: str = Query(..., description="Customer phone number")
+def get_contact(
+    phone_number: str = Query(..., description="Customer phone number"),
+    contact_service: ContactInfoService = Depends(get_contact_service)
 ):
     """
     Get a contact by phone number.
@@ -124,17 +178,33 @@ async def get_contact(
         )
 
 
+def _contact_list_json(contacts: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Encode contacts as a ContactListResponse JSON document piece by piece,
+    so the whole list is never held in memory.
+    """
+    yield '{"contacts":['
+    total = 0
+    for contact in contacts:
+        yield ("," if total else "") + ContactResponse(**contact).model_dump_json()
+        total += 1
+    yield f'],"total":{total}}}'
+
+
 @router.get(
     "/all",
     response_model=ContactListResponse,
+    response_class=StreamingResponse,
     responses={
         500: {"description": "Internal server error"}
     }
 )
-async def get_all_contacts():
+def get_all_contacts(contact_service: ContactInfoService = Depends(get_contact_service)):
     """
     Get all contacts.
     
+    The list is streamed from a server-side cursor as it is encoded.
+
     Returns:
         ContactListResponse: List of all contacts
         
@@ -143,11 +213,8 @@ async def get_all_contacts():
     """
     try:
         contacts = contact_service.get_all_contacts()
-        
-        return ContactListResponse(
-            contacts=[ContactResponse(**contact) for contact in contacts],
-            total=len(contacts)
-        )
+        # Pull the first row here so that query errors still map to an HTTP status
+        first = list(itertools.islice(contacts, 1))
 
     except Exception as e:
         raise HTTPException(
@@ -155,20 +222,27 @@ async def get_all_contacts():
             detail={"detail": f"Failed to retrieve contacts: {str(e)}"}
         )
 
+    return StreamingResponse(
+        _contact_list_json(itertools.chain(first, contacts)),
+        media_type="application/json"
+    )
+
 
 @router.put(
     "",
     response_model=StatusResponse,
     responses={
         404: {"description": "Contact not found"},
+        409: {"description": "New phone number already belongs to another contact"},
         422: {"description": "Invalid contact data"},
         500: {"description": "Internal server error"}
     }
 )
-async def update_contact(
+def update_contact(
     phone_number: str = Query(..., description="Current phone number"),
     customer_name: Optional[str] = Query(None, description="New customer name"),
-    new_phone_number: Optional[str] = Query(None, description="New phone number")
+    new_phone_number: Optional[str] = Query(None, description="New phone number"),
+    contact_service: ContactInfoService = Depends(get_contact_service)
 ):
     """
     Update an existing contact.
@@ -191,15 +265,23 @@ async def update_contact(
 
     except ContactNotFoundException as e:
         # Handle the case when contact is not found - return 404
-        logger.warning(f"Contact not found for update: {decoded_phone}")
+        logger.warning("Contact not found for update: %s", decoded_phone)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.detail
         )
     
+    except ContactAlreadyExistsException as e:
+        # Handle the new phone number clashing with another contact - return 409
+        logger.warning("Contact already exists for new phone number: %s", new_phone_number)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.detail
+        )
+    
     except DatabaseConnectionException as e:
         # Handle database connection errors - return 503
-        logger.error(f"Database connection error: {str(e)}")
+        logger.error("Database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=e.detail
@@ -207,7 +289,7 @@ async def update_contact(
     
     except Exception as e:
         # Handle any other unexpected errors - return 500
-        logger.error(f"Unexpected error while updating contact: {str(e)}")
+        logger.error("Unexpected error while updating contact: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update contact: {str(e)}"
@@ -222,8 +304,9 @@ async def update_contact(
         500: {"description": "Internal server error"}
     }
 )
-async def delete_contact(
-    phone_number: str = Query(..., description="Customer phone number")
+def delete_contact(
+    phone_number: str = Query(..., description="Customer phone number"),
+    contact_service: ContactInfoService = Depends(get_contact_service)
 ):
     """
     Delete a contact by phone number.
@@ -251,7 +334,7 @@ async def delete_contact(
 
     except ContactNotFoundException as e:
         # Handle the case when contact is not found - return 404
-        logger.warning(f"Contact not found for deletion: {decoded_phone}")
+        logger.warning("Contact not found for deletion: %s", decoded_phone)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.detail
@@ -259,7 +342,7 @@ async def delete_contact(
     
     except DatabaseConnectionException as e:
         # Handle database connection errors - return 503
-        logger.error(f"Database connection error: {str(e)}")
+        logger.error("Database connection error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=e.detail
@@ -267,7 +350,7 @@ async def delete_contact(
     
     except Exception as e:
         # Handle any other unexpected errors - return 500
-        logger.error(f"Unexpected error while deleting contact: {str(e)}")
+        logger.error("Unexpected error while deleting contact: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete contact: {str(e)}"
@@ -1,18 +1,28 @@
-from fastapi import APIRouter, HTTPException, status, Query
+import itertools
+from typing import List, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 
 from app.exceptions.conversation.conversation_exception import ConversationException
 from app.exceptions.database.database_connection_exception import DatabaseConnectionException
 from app.models.conversation.customer_data_request_model import CustomerDataRequestModel
 from app.models.conversation.customer_data_response_model import (
+    BulkCustomerResponseModel,
     CustomerDataResponseModel,
     CustomerResponseModel
 )
 from app.models.enum.response_status import ResponseStatus
-from app.services.conversation_service import conversation_service
+from app.services.conversation_service import ConversationService, get_conversation_service
 
 # Create API router
 router = APIRouter(prefix="/conversations")
 
+# Handlers are plain functions: ConversationService uses blocking psycopg2, so
+# FastAPI runs them in its threadpool instead of on the event loop.
+# The service is created lazily on the first request through get_conversation_service.
+
 
 @router.post(
     "",
@@ -24,7 +34,10 @@ router = APIRouter(prefix="/conversations")
     },
     response_model=CustomerResponseModel
 )
-async def create_conversation_data(call_data: CustomerDataRequestModel):
+def create_conversation_data(
+        call_data: CustomerDataRequestModel,
+        conversation_service: ConversationService = Depends(get_conversation_service)
+):
     """
     Save conversation data to the database.
 
@@ -54,6 +67,48 @@ async def create_conversation_data(call_data: CustomerDataRequestModel):
         )
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        409: {"description": "A call SID in the batch already exists. Please try again."},
+        500: {"description": "Internal server error"},
+        503: {"description": "Service unavailable"}
+    },
+    response_model=BulkCustomerResponseModel
+)
+def create_conversation_data_bulk(
+        calls_data: List[CustomerDataRequestModel],
+        conversation_service: ConversationService = Depends(get_conversation_service)
+):
+    """
+    Save many conversations to the database in a single batch.
+
+    Args:
+        calls_data (List[CustomerDataRequestModel]): The conversation data to save
+
+    Returns:
+        BulkCustomerResponseModel: Customer ID of each conversation with the request status
+    """
+    try:
+        customer_ids = conversation_service.save_conversation_data_bulk(calls_data)
+        return BulkCustomerResponseModel(
+            customer_ids=customer_ids,
+            status=ResponseStatus.SUCCESS
+        )
+
+    except (ConversationException, DatabaseConnectionException) as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while creating conversation records. Please try again later."
+        )
+
+
 @router.get(
     "",
     responses={
@@ -64,9 +119,14 @@ async def create_conversation_data(call_data: CustomerDataRequestModel):
     },
     response_model=CustomerDataResponseModel
 )
-async def get_conversation_data(
+def get_conversation_data(
         page: int = Query(1, description="Number of pages to return"),
-        per_page: int = Query(10, le=100, description="Number of items per page"),
+        per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
+        cursor: Optional[str] = Query(
+            None,
+            description="next_cursor of the previous page; when given, page is ignored"
+        ),
+        conversation_service: ConversationService = Depends(get_conversation_service)
 ):
     """
     Retrieve the conversation data from the database
@@ -74,6 +134,7 @@ async def get_conversation_data(
     Args:
         page (int): Number of pages to return
         per_page (int): Number of items per page
+        cursor (Optional[str]): Keyset cursor returned as next_cursor by the previous page
 
     Returns:
         CustomerDataResponseModel: The conversation artifacts from the database
@@ -81,7 +142,8 @@ async def get_conversation_data(
     try:
         conversation_data = conversation_service.get_conversation_data(
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor
         )
         return conversation_data
 
@@ -95,3 +157,44 @@ async def get_conversation_data(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching conversation records. Please try again later."
         )
+
+
+@router.get(
+    "/export",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        500: {"description": "Internal server error"},
+        503: {"description": "Service unavailable"}
+    },
+    response_class=StreamingResponse
+)
+def export_conversation_data(
+        conversation_service: ConversationService = Depends(get_conversation_service)
+):
+    """
+    Stream every conversation from the database as newline-delimited JSON,
+    newest first, without building the whole result in memory.
+
+    Returns:
+        StreamingResponse: One CustomerDataRequestModel JSON object per line
+    """
+    try:
+        payloads = conversation_service.stream_conversation_data()
+        # Pull the first row here so that query errors still map to an HTTP status
+        first = list(itertools.islice(payloads, 1))
+
+    except (ConversationException, DatabaseConnectionException) as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while exporting conversation records. Please try again later."
+        )
+
+    return StreamingResponse(
+        (orjson.dumps(payload) + b"\n" for payload in itertools.chain(first, payloads)),
+        media_type="application/x-ndjson"
+    )
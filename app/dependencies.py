@@ -0,0 +1,31 @@
+from typing import Iterator
+
+from fastapi import HTTPException
+from psycopg2.extensions import connection as Connection
+
+from app.exceptions.database.database_connection_exception import DatabaseConnectionException
+from app.services.db_service import PostgresClient
+
+
+# Shared client used to hand out request-scoped connections
+db_client = PostgresClient()
+
+
+def get_conn() -> Iterator[Connection]:
+    """
+    Yields one database connection per HTTP request.
+
+    Every service call made while handling the request shares this
+    connection, and it is released once the response has been sent.
+    When no connection frees up in time, or the database cannot be reached,
+    the request fails with 503.
+    """
+    try:
+        conn = db_client.getconn()
+    except DatabaseConnectionException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    try:
+        yield conn
+    finally:
+        db_client.putconn(conn)
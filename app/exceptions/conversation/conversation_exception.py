@@ -18,3 +18,9 @@ class ConversationAlreadyExistsException(ConversationException):
     """Exception raised when a conversation already exists."""
     status_code = status.HTTP_409_CONFLICT
     detail = "Call with SID already exists. Please try again."
+
+
+class InvalidConversationCursorException(ConversationException):
+    """Exception raised when a pagination cursor cannot be decoded."""
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Invalid pagination cursor."
@@ -117,4 +117,23 @@ class StatusResponse(BaseModel):
                 "message": "Contact saved successfully",
                 "id": "550e8400-e29b-41d4-a716-446655440000"
             }
-        }
\ No newline at end of file
+        }
+
+
+class BulkStatusResponse(BaseModel):
+    """Response model for bulk operations"""
+    status: str = Field(..., description="Status of the operation (success/error)")
+    message: str = Field(..., description="Descriptive message")
+    ids: list[str] = Field(default_factory=list, description="IDs of the affected records")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "success",
+                "message": "2 contacts saved successfully",
+                "ids": [
+                    "550e8400-e29b-41d4-a716-446655440000",
+                    "660e8400-e29b-41d4-a716-446655440001"
+                ]
+            }
+        }
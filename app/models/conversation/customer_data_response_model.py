@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 from app.models.conversation.customer_data_request_model import CustomerDataRequestModel
 from app.models.enum.response_status import ResponseStatus
@@ -11,11 +11,17 @@ class CustomerResponseModel(BaseModel):
     status: ResponseStatus
 
 
+class BulkCustomerResponseModel(BaseModel):
+    customer_ids: List[int]
+    status: ResponseStatus
+
+
 class MetadataModel(BaseModel):
     total_items: int
     total_pages: int
     current_page: int
     per_page: int
+    next_cursor: Optional[str] = None
 
 
 class CustomerDataResponseModel(BaseModel):
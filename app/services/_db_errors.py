@@ -0,0 +1,76 @@
+import functools
+import inspect
+import logging
+from typing import Callable, Optional
+
+import psycopg2
+from psycopg2.errors import UniqueViolation
+
+from app.exceptions.database.database_connection_exception import DatabaseConnectionException
+
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+
+def db_errors(op_name: str, already_exists: Optional[Callable[..., Exception]] = None):
+    """
+    Decorator handling the shared error branches of a DB operation.
+    Transactions are committed/rolled back by the `with conn:` block of the
+    decorated method, so only error translation and logging happen here.
+
+    - UniqueViolation is translated with `already_exists` (called with the
+      decorated method's arguments) when provided.
+    - psycopg2 errors are wrapped into DatabaseConnectionException.
+    - Any other exception (e.g. not-found errors) is logged and re-raised.
+
+    Error messages are only formatted when the corresponding branch is taken.
+    Generator functions are supported; their errors are translated while iterating.
+
+    Args:
+        op_name: Name of the operation, used in logs and error details
+        already_exists: Factory building the exception raised on unique violations
+    """
+    def translate(e: Exception, args, kwargs) -> Exception:
+        if already_exists is not None and isinstance(e, UniqueViolation):
+            error = already_exists(*args, **kwargs)
+            logger.error("Error during %s: %s", op_name, error.detail)
+            return error
+
+        if isinstance(e, (DatabaseConnectionException, psycopg2.Error)):
+            error_message = f"Database error during {op_name}: {str(e)}"
+            logger.error(error_message)
+            return DatabaseConnectionException(detail=error_message)
+
+        logger.error("Error during %s: %s", op_name, e)
+        return e
+
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            # Errors of a generator surface while it is iterated, not when it is called
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+
+                except Exception as e:
+                    error = translate(e, args, kwargs)
+                    if error is e:
+                        raise
+                    raise error from e
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+
+            except Exception as e:
+                error = translate(e, args, kwargs)
+                if error is e:
+                    raise
+                raise error from e
+
+        return wrapper
+    return decorator
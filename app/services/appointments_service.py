@@ -2,17 +2,17 @@ import logging
 import psycopg2
 
 from typing import Dict, Any, Optional
+from psycopg2.extensions import connection as Connection
 from psycopg2.extras import DictCursor
-from psycopg2.errors import UniqueViolation
 
 from app.exceptions.appointment.appointment_exceptions import (
     AppointmentNotFoundError,
     AppointmentAlreadyExistsError
 )
-from config import APPOINTMENTS_TABLE_NAME
-from app.exceptions.database.database_connection_exception import DatabaseConnectionException
+from config import APPOINTMENTS_TABLE_NAME, DB_INIT_SCHEMA
 from app.exceptions.database.database_initialization_exception import DatabaseInitializationException
-from app.services.db_service import PostgresClient
+from app.services._db_errors import db_errors
+from app.services.db_service import PostgresClient, execute_prepared
 from singleton import SingletonMeta
 
 
@@ -32,22 +32,16 @@ class AppointmentService(metaclass=SingletonMeta):
         self.db_client = PostgresClient()
         self.table_name = APPOINTMENTS_TABLE_NAME
 
-        # Initialize the db tables
-        self._initialize_db()
+        # Initialize the db tables, unless the schema is applied outside the app
+        if DB_INIT_SCHEMA:
+            self._initialize_db()
 
     def _initialize_db(self):
         """
         Creates the 'appointments' table if it doesn't already exist.
         """
-        conn = None
         try:
-            logger.info(f"Initializing database schema for {self.table_name}...")
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseInitializationException(
-                    detail="Failed to connect to DB."
-                )
-
+            logger.info("Initializing database schema for %s...", self.table_name)
             create_table_query = f"""
             CREATE TABLE IF NOT EXISTS {self.table_name} (
                 id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -62,15 +56,12 @@ class AppointmentService(metaclass=SingletonMeta):
             );
             """
 
-            with conn.cursor() as cur:
+            with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
                 cur.execute(create_table_query)
-            conn.commit()
-            logger.info(f"Table '{self.table_name}' initialized successfully.")
+            logger.info("Table '%s' initialized successfully.", self.table_name)
 
         except psycopg2.Error as ex:
-            if conn:
-                conn.rollback()
-            logger.error(f'Error while creating table for table:{self.table_name}: {str(ex)}')
+            logger.error("Error while creating table for table:%s: %s", self.table_name, ex)
             raise DatabaseInitializationException(
                 detail=f'There was an error during schema initialization for table:{self.table_name}: {str(ex)}'
             )
@@ -81,278 +72,161 @@ class AppointmentService(metaclass=SingletonMeta):
             logger.error(error_message)
             raise DatabaseInitializationException(detail=error_message)
 
-        finally:
-            if conn:
-                conn.close()
-
-    def create_appointment(self, data: Dict[str, Any]) -> Optional[str]:
+    @db_errors(
+        "create_appointment",
+        already_exists=lambda self, conn, data: AppointmentAlreadyExistsError(
+            detail=f"Error: Appointment already exists for phone {data['customer_phone_number']}"
+        )
+    )
+    def create_appointment(self, conn: Connection, data: Dict[str, Any]) -> Optional[str]:
         """
         Creates a new appointment record.
-        """
-        conn = None
-        try:
-            # Connect to the DB
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            # Insert appointment using explicit SQL
-            sql_query = f"""
-                        INSERT INTO {self.table_name} (
-                            customer_name, \
-                            customer_phone_number, \
-                            appointment_date, \
-                            appointment_time, \
-                            vehicle_details, \
-                            service, \
-                            remarks
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s) RETURNING id; \
-                        """
-
-            # Execute the query
-            with conn.cursor() as cur:
-                cur.execute(sql_query, (
-                    data.get('customer_name'),
-                    data.get('customer_phone_number'),
-                    data.get('appointment_date'),
-                    data.get('appointment_time'),
-                    data.get('vehicle_details'),
-                    data.get('service'),
-                    data.get('remarks')
-                ))
-                appointment_id = cur.fetchone()[0]
-
-            conn.commit()
-            logger.info(f"Successfully created record for {data['customer_phone_number']}")
-            return str(appointment_id)
-
-        except UniqueViolation:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            error_message = f"Error: Appointment already exists for phone {data['customer_phone_number']}"
-            logger.error(error_message)
-            raise AppointmentAlreadyExistsError(detail=error_message)
-
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            error_message = f"There was a DB error occurred during establishing the connection: {str(e)}"
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
-
-        except Exception as e:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            logger.error(f"There was an error occurred while creating an appointment: {str(e)}")
-            raise
-
-        finally:
-            if conn:
-                conn.close()
 
-    def get_appointment_by_phone_number(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        Args:
+            conn: Request-scoped database connection
+            data: Appointment fields to insert
         """
-        Retrieves an appointment record based on the phone number.
+        # Insert appointment using explicit SQL
+        sql_query = f"""
+                    INSERT INTO {self.table_name} (
+                        customer_name, \
+                        customer_phone_number, \
+                        appointment_date, \
+                        appointment_time, \
+                        vehicle_details, \
+                        service, \
+                        remarks
+                    )
+                    VALUES ($1, $2, $3, $4, $5, $6, $7) RETURNING id \
+                    """
+
+        # Execute the query in a single transaction, prepared once per pooled connection
+        with conn, conn.cursor() as cur:
+            execute_prepared(cur, "create_appointment", sql_query, (
+                data.get('customer_name'),
+                data.get('customer_phone_number'),
+                data.get('appointment_date'),
+                data.get('appointment_time'),
+                data.get('vehicle_details'),
+                data.get('service'),
+                data.get('remarks')
+            ))
+            appointment_id = cur.fetchone()[0]
+
+        logger.info("Successfully created record for %s", data['customer_phone_number'])
+        return str(appointment_id)
+
+    @db_errors("get_appointment_by_phone_number")
+    def get_appointment_by_phone_number(self, conn: Connection, phone_number: str) -> Optional[Dict[str, Any]]:
         """
-        conn = None
-        try:
-            # Connect to the DB
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            # Select appointment using explicit SQL
-            sql_query = f"""
-                        SELECT id, \
-                               customer_name, \
-                               customer_phone_number, \
-                               appointment_date, \
-                               appointment_time, \
-                               vehicle_details, \
-                               service, \
-                               remarks
-                        FROM {self.table_name}
-                        WHERE customer_phone_number = %s; \
-                        """
-
-            # Execute the query
-            with conn.cursor(cursor_factory=DictCursor) as cur:
-                cur.execute(sql_query, (phone_number,))
-                result = cur.fetchone()
-
-            if not result:
-                raise AppointmentNotFoundError(
-                    detail=f"Phone: {phone_number} does not have any appointments"
-                )
-            return dict(result)
+        Retrieves an appointment record based on the phone number.
 
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            error_message = (
-                f"There was an error establishing connection to the DB during fetching an appointment "
-                f"by phone number {phone_number}: {str(e)}"
+        Args:
+            conn: Request-scoped database connection
+            phone_number: Customer phone number to look up
+        """
+        # Select appointment using explicit SQL
+        sql_query = f"""
+                    SELECT id, \
+                           customer_name, \
+                           customer_phone_number, \
+                           appointment_date, \
+                           appointment_time, \
+                           vehicle_details, \
+                           service, \
+                           remarks
+                    FROM {self.table_name}
+                    WHERE customer_phone_number = $1 \
+                    """
+
+        # Execute the query, prepared once per pooled connection
+        with conn, conn.cursor(cursor_factory=DictCursor) as cur:
+            execute_prepared(cur, "get_appointment", sql_query, (phone_number,))
+            result = cur.fetchone()
+
+        if not result:
+            raise AppointmentNotFoundError(
+                detail=f"Phone: {phone_number} does not have any appointments"
             )
-            logger.error(error_message)
-            raise DatabaseConnectionException(error_message)
+        return dict(result)
 
-        except AppointmentNotFoundError as e:
-            logger.error(
-                f"There was an error occurred while fetching an appointment : {str(e)}"
-            )
-            raise
+    @db_errors("update_appointment")
+    def update_appointment(self, conn: Connection, data: Dict[str, Any]) -> Optional[bool]:
+        """
+        Updates an existing appointment record identified by phone number.
 
-        except Exception as e:
-            logger.error(
-                f"There was an error occurred while fetching appointment by phone number {phone_number}: {str(e)}"
-            )
-            raise
+        Args:
+            conn: Request-scoped database connection
+            data: Appointment fields to update, keyed by column name
+        """
+        # Extract the customer phone number
+        phone_number = data['customer_phone_number']
+
+        # Build dynamic UPDATE query based on provided fields
+        update_fields = []
+        values = []
+        for key, value in data.items():
+            if key != 'customer_phone_number' and value is not None:
+                update_fields.append(f"{key} = %s")
+                values.append(value)
+
+        # Check for valid fields
+        if not update_fields:
+            logger.warning("No fields to update for phone number %s", phone_number)
+            return True
 
-        finally:
-            if conn:
-                conn.close()
+        # Add phone number for WHERE clause
+        values.append(phone_number)
 
-    def update_appointment(self, data: Dict[str, Any]) -> Optional[bool]:
-        """
-        Updates an existing appointment record identified by phone number.
+        # Formulate the SQL query
+        sql_query = f"""
+            UPDATE {self.table_name}
+            SET {', '.join(update_fields)}
+            WHERE customer_phone_number = %s
+            RETURNING id;
         """
-        conn = None
-        try:
-            # Connect to the DB
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            # Extract the customer phone number
-            phone_number = data['customer_phone_number']
-
-            # Build dynamic UPDATE query based on provided fields
-            update_fields = []
-            values = []
-            for key, value in data.items():
-                if key != 'customer_phone_number' and value is not None:
-                    update_fields.append(f"{key} = %s")
-                    values.append(value)
-
-            # Check for valid fields
-            if not update_fields:
-                logger.warning(f"No fields to update for phone number {phone_number}")
-                return True
-
-            # Add phone number for WHERE clause
-            values.append(phone_number)
-
-            # Formulate the SQL query
-            sql_query = f"""
-                UPDATE {self.table_name}
-                SET {', '.join(update_fields)}
-                WHERE customer_phone_number = %s
-                RETURNING id;
-            """
 
-            # Execute the query
-            with conn.cursor() as cur:
-                cur.execute(sql_query, tuple(values))
-                result = cur.fetchone()
-            conn.commit()
+        # Execute the query in a single transaction
+        with conn, conn.cursor() as cur:
+            cur.execute(sql_query, tuple(values))
+            result = cur.fetchone()
 
             if not result:
                 raise AppointmentNotFoundError(
                     detail=f"Phone: {phone_number} does not have any appointments to update with."
                 )
 
-            logger.info(f"Successfully updated appointment for {phone_number}")
-            return True
-
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            if conn:
-                conn.rollback()
-            error_message = (
-                f"There was an error establishing connection to the DB during updating an appointment: {str(e)}"
-            )
-            logger.error(error_message)
-            raise DatabaseConnectionException(error_message)
+        logger.info("Successfully updated appointment for %s", phone_number)
+        return True
 
-        except AppointmentNotFoundError as e:
-            if conn:
-                conn.rollback()
-            logger.error(
-                f"There was an error occurred while updating an appointment: {str(e)}"
-            )
-            raise
-
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(
-                f"There was an error occurred while updating an appointment: {str(e)}"
-            )
-            raise
-
-        finally:
-            if conn:
-                conn.close()
-
-    def delete_appointment_by_phone_number(self, phone_number: str) -> bool:
+    @db_errors("delete_appointment_by_phone_number")
+    def delete_appointment_by_phone_number(self, conn: Connection, phone_number: str) -> bool:
         """
         Deletes an appointment record based on the phone number.
+
+        Args:
+            conn: Request-scoped database connection
+            phone_number: Customer phone number whose appointment is deleted
         """
-        conn = None
-        try:
-            # Connect to the DB
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            # Delete appointment using explicit SQL
-            sql_query = f"""
-                        DELETE \
-                        FROM {self.table_name}
-                        WHERE customer_phone_number = %s RETURNING id; \
-                        """
-
-            # Execute the query
-            with conn.cursor() as cur:
-                cur.execute(sql_query, (phone_number,))
-                result = cur.fetchone()
-            conn.commit()
+        # Delete appointment using explicit SQL
+        sql_query = f"""
+                    DELETE \
+                    FROM {self.table_name}
+                    WHERE customer_phone_number = $1 RETURNING id \
+                    """
+
+        # Execute the query in a single transaction, prepared once per pooled connection
+        with conn, conn.cursor() as cur:
+            execute_prepared(cur, "delete_appointment", sql_query, (phone_number,))
+            result = cur.fetchone()
 
             if not result:
                 raise AppointmentNotFoundError(
                     detail=f"Phone: {phone_number} does not have any appointments to delete."
                 )
 
-            logger.info(f"Successfully deleted appointment for {phone_number}")
-            return True
-
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            if conn:
-                conn.rollback()
-            error_message = (
-                f"There was an error establishing connection to the DB during deleting an appointment: {str(e)}"
-            )
-            logger.error(error_message)
-            raise DatabaseInitializationException(error_message)
-
-        except AppointmentNotFoundError as e:
-            if conn:
-                conn.rollback()
-            logger.error(
-                f"There was an error occurred while deleting an appointment: {str(e)}"
-            )
-            raise
-
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"There was an error occurred while deleting an appointment: {str(e)}")
-            raise
-
-        finally:
-            if conn:
-                conn.close()
+        logger.info("Successfully deleted appointment for %s", phone_number)
+        return True
 
 
 appointment_service = AppointmentService()
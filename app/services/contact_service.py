@@ -1,20 +1,42 @@
+import csv
+import functools
+import io
 import uuid
 import logging
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.errors import UniqueViolation
-from app.services.db_service import PostgresClient
+from psycopg2.extensions import connection as Connection
+from psycopg2.extras import execute_values
+from app.services._db_errors import db_errors
+from app.services._ttl_cache import MISSING, TTLCache
+from app.services.db_service import PostgresClient, execute_prepared
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
 
-from config import CONTACT_INFO_TABLE_NAME, APPOINTMENTS_TABLE_NAME
-from app.exceptions.database.database_connection_exception import DatabaseConnectionException
+from config import CONTACT_INFO_TABLE_NAME, APPOINTMENTS_TABLE_NAME, DB_INIT_SCHEMA
 from app.exceptions.database.database_initialization_exception import DatabaseInitializationException
 from singleton import SingletonMeta
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Rows per multi-VALUES INSERT statement for bulk saves
+BULK_PAGE_SIZE = 500
+
+# Batches larger than this are staged through COPY instead of INSERT ... VALUES
+BULK_COPY_THRESHOLD = 10_000
+
+# Customer names are cached per phone number for a short while
+CUSTOMER_NAME_CACHE_SIZE = 10_000
+CUSTOMER_NAME_CACHE_TTL = 60
+
+# Column order of the contact SELECTs, used to map tuple rows to dicts
+CONTACT_FIELDS = ("id", "customer_name", "contact_number", "date", "created_at", "updated_at")
+CONTACT_SUMMARY_FIELDS = CONTACT_FIELDS + ("summary",)
+
+# Rows fetched per round trip when streaming all contacts
+CONTACTS_STREAM_ITERSIZE = 2000
+
 # Define the DB table name
 
 
@@ -38,27 +60,26 @@ class ContactInfoService(metaclass=SingletonMeta):
     Service layer for managing contact information, handling business logic
     and database operations.
     """
+    # UPDATE statements keyed by the tuple of columns being set
+    _update_queries: Dict[Tuple[str, ...], str] = {}
+
     def __init__(self):
         self.db_client = PostgresClient()
         self.table_name = CONTACT_INFO_TABLE_NAME
+        self._name_cache = TTLCache(maxsize=CUSTOMER_NAME_CACHE_SIZE, ttl=CUSTOMER_NAME_CACHE_TTL)
+        # Phone numbers whose cached name is dropped once the transaction() using that connection commits
+        self._pending_name_pops: Dict[Connection, Set[str]] = {}
         
-        # Initialize the db tables
-        self._initialize_db()
+        # Initialize the db tables, unless the schema is applied outside the app
+        if DB_INIT_SCHEMA:
+            self._initialize_db()
     
     def _initialize_db(self):
         """
         Creates the 'users_contact_info' table if it doesn't already exist.
         """
-        conn = None
         try:
-            logger.info(f"Initializing database schema for {self.table_name}...")
-            
-            # Create a new connection for initialization
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseInitializationException(
-                    detail="Failed to connect to database for initialization"
-                )
+            logger.info("Initializing database schema for %s...", self.table_name)
             
             create_table_query = f"""
             CREATE TABLE IF NOT EXISTS {self.table_name} (
@@ -75,39 +96,69 @@ class ContactInfoService(metaclass=SingletonMeta):
             CREATE INDEX IF NOT EXISTS idx_contact_number ON {self.table_name}(contact_number);
             """
 
-            with conn.cursor() as cur:
+            # Initialization runs in its own transaction on a dedicated connection.
+            # The advisory lock makes concurrently booting workers run the DDL one
+            # at a time; it is released when the transaction commits.
+            with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s));", (self.table_name,))
                 cur.execute(create_table_query)
                 cur.execute(create_index_query)
             
-            conn.commit()
-            logger.info(f"Table '{self.table_name}' initialized successfully.")
+            logger.info("Table '%s' initialized successfully.", self.table_name)
 
         except psycopg2.Error as ex:
-            if conn:
-                conn.rollback()
-            logger.error(f'Error while creating table for {self.table_name}: {str(ex)}')
+            logger.error('Error while creating table for %s: %s', self.table_name, ex)
             raise DatabaseInitializationException(
                 detail=f'There was an error during schema initialization for {self.table_name}: {str(ex)}'
             )
         except Exception as e:
-            if conn:
-                conn.rollback()
             error_message = (
                 f"There was an error during schema initialization for {self.table_name}: {str(e)}"
             )
             logger.error(error_message)
             raise DatabaseInitializationException(detail=error_message)
-        finally:
-            # Always close the connection after initialization
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after initialization")
     
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """
+        Share one transaction between several calls, committed when the block exits.
+        Pass the yielded connection as `conn` to the service methods.
+        Cached customer names changed inside the block are dropped after the commit.
+        """
+        with self.db_client.transaction() as conn:
+            pending = self._pending_name_pops[conn] = set()
+            try:
+                yield conn
+            finally:
+                del self._pending_name_pops[conn]
+
+        self._invalidate_names(None, pending)
+
+    def _invalidate_names(self, conn: Optional[Connection], contact_numbers: Iterable[str]):
+        """
+        Drop the cached names of `contact_numbers`. When `conn` belongs to an open
+        transaction(), this waits for its commit, so that a concurrent lookup
+        cannot cache the old name again before the change is visible.
+
+        `conn` must be the connection the caller passed in, not the one borrowed for
+        the write: that one is already back in the pool and may belong to another
+        thread's transaction().
+        """
+        pending = self._pending_name_pops.get(conn) if conn is not None else None
+        if pending is not None:
+            pending.update(contact_numbers)
+            return
+
+        for contact_number in contact_numbers:
+            self._name_cache.pop(contact_number)
+
+    @db_errors("save_contact_info")
     def save_contact_info(
         self, 
         customer_name: str, 
         contact_number: str, 
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        conn: Optional[Connection] = None
     ) -> Optional[str]:
         """
         Save contact information to users_contact_info table.
@@ -117,6 +168,7 @@ class ContactInfoService(metaclass=SingletonMeta):
             customer_name: Name of the customer
             contact_number: Contact phone number
             date: Date of contact (defaults to current datetime)
+            conn: Connection of an ongoing transaction to join (optional)
         
         Returns:
             ID of the created/updated record or None if failed
@@ -124,214 +176,275 @@ class ContactInfoService(metaclass=SingletonMeta):
         if date is None:
             date = datetime.now()
         
-        conn = None
-        try:
-            # Create a new connection for this operation
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database")
-
-            # Check if contact already exists
-            check_query = f"""
-                SELECT id FROM {self.table_name} 
-                WHERE contact_number = %s;
-            """
-            
-            with conn.cursor() as cur:
-                cur.execute(check_query, (contact_number,))
-                existing_record = cur.fetchone()
-            
-            if existing_record:
-                # Update existing record
-                logger.info(f"Contact number {contact_number} already exists. Updating record...")
-                update_query = f"""
-                    UPDATE {self.table_name}
-                    SET customer_name = %s,
-                        date = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE contact_number = %s
-                    RETURNING id;
-                """
-                
-                with conn.cursor() as cur:
-                    cur.execute(update_query, (customer_name, date, contact_number))
-                    contact_id = cur.fetchone()[0]
-                
-                conn.commit()
-                logger.info(f"Contact info updated successfully for: {contact_number}")
-                return str(contact_id)
+        # Insert the contact, or update the existing record for this phone number
+        upsert_query = f"""
+            INSERT INTO {self.table_name} (
+                customer_name,
+                contact_number,
+                date
+            )
+            VALUES ($1, $2, $3)
+            ON CONFLICT (contact_number) DO UPDATE
+            SET customer_name = EXCLUDED.customer_name,
+                date = EXCLUDED.date,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id
+        """
+
+        with self.db_client.transaction(conn) as tx_conn, tx_conn.cursor() as cur:
+            execute_prepared(cur, "save_contact", upsert_query, (customer_name, contact_number, date))
+            contact_id = cur.fetchone()[0]
+
+        self._invalidate_names(conn, (contact_number,))
+        logger.info("Contact info saved successfully for %s with ID: %s", contact_number, contact_id)
+        return str(contact_id)
+
+    @db_errors("save_contacts_bulk")
+    def save_contacts_bulk(
+        self,
+        rows: List[Tuple[str, str, Optional[datetime]]],
+        conn: Optional[Connection] = None
+    ) -> List[str]:
+        """
+        Save many contacts at once, updating the records of phone numbers that already exist.
+
+        Small batches are sent as multi-row INSERT ... VALUES statements; batches above
+        BULK_COPY_THRESHOLD are streamed into a temporary table with COPY and merged
+        with a single INSERT ... SELECT.
+
+        Args:
+            rows: (customer_name, contact_number, date) tuples; a None date defaults to now
+            conn: Connection of an ongoing transaction to join (optional)
+
+        Returns:
+            IDs of the created/updated records
+        """
+        now = datetime.now()
+
+        # Keep the last row per phone number, a single upsert cannot touch a row twice
+        deduplicated = {
+            contact_number: (customer_name, contact_number, date or now)
+            for customer_name, contact_number, date in rows
+        }
+        values = list(deduplicated.values())
+        if not values:
+            return []
+
+        upsert_clause = """
+            ON CONFLICT (contact_number) DO UPDATE
+            SET customer_name = EXCLUDED.customer_name,
+                date = EXCLUDED.date,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id
+        """
+
+        with self.db_client.transaction(conn) as tx_conn, tx_conn.cursor() as cur:
+            if len(values) > BULK_COPY_THRESHOLD:
+                cur.execute("""
+                    CREATE TEMP TABLE contacts_staging (
+                        customer_name VARCHAR(255),
+                        contact_number VARCHAR(20),
+                        date TIMESTAMP
+                    ) ON COMMIT DROP;
+                """)
+
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(values)
+                buffer.seek(0)
+                cur.copy_expert(
+                    "COPY contacts_staging (customer_name, contact_number, date) FROM STDIN WITH CSV",
+                    buffer
+                )
+
+                cur.execute(f"""
+                    INSERT INTO {self.table_name} (customer_name, contact_number, date)
+                    SELECT customer_name, contact_number, date FROM contacts_staging
+                    {upsert_clause};
+                """)
+                contact_ids = [row[0] for row in cur.fetchall()]
+
+                # Drop it now rather than at commit, the transaction may be shared with later calls
+                cur.execute("DROP TABLE contacts_staging;")
             else:
-                # Create new record
-                logger.info(f"Creating new contact for: {contact_number}")
-                insert_query = f"""
-                    INSERT INTO {self.table_name} (
-                        customer_name,
-                        contact_number,
-                        date
+                contact_ids = [
+                    row[0] for row in execute_values(
+                        cur,
+                        f"""
+                            INSERT INTO {self.table_name} (customer_name, contact_number, date)
+                            VALUES %s
+                            {upsert_clause}
+                        """,
+                        values,
+                        page_size=BULK_PAGE_SIZE,
+                        fetch=True
                     )
-                    VALUES (%s, %s, %s)
-                    RETURNING id;
-                """
-                
-                with conn.cursor() as cur:
-                    cur.execute(insert_query, (customer_name, contact_number, date))
-                    contact_id = cur.fetchone()[0]
-                
-                conn.commit()
-                logger.info(f"Contact info saved successfully with ID: {contact_id}")
-                return str(contact_id)
-                
-        except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
-            error_message = f"Database error while saving contact info: {str(e)}"
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
+                ]
+
+        self._invalidate_names(conn, deduplicated)
+
+        logger.info("Saved %d contacts in bulk", len(contact_ids))
+        return [str(contact_id) for contact_id in contact_ids]
+
+    @db_errors("get_customers_by_contacts")
+    def get_customers_by_contacts(
+        self,
+        contact_numbers: List[str],
+        conn: Optional[Connection] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get customer information for several contact numbers in one query
         
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Failed to save contact info: {str(e)}")
-            raise
+        Args:
+            contact_numbers: Contact phone numbers to search
+            conn: Connection of an ongoing transaction to join (optional)
         
-        finally:
-            # Always close the connection
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after save operation")
+        Returns:
+            Dictionary mapping each found contact number to its customer info;
+            numbers without a contact are left out
+        """
+        if not contact_numbers:
+            return {}
+
+        # Retrieves the contact details with summary from the previous conversation
+        sql_query = f"""
+            SELECT 
+                u.id,
+                u.customer_name,
+                u.contact_number,
+                u.date,
+                u.created_at,
+                u.updated_at,
+                (
+                    -- Only the latest call's summary is needed, so stop at one row
+                    SELECT s.summary
+                    FROM customers cu
+                    JOIN calls c
+                        ON c.customer_id = cu.customer_id
+                    JOIN summaries s
+                        ON s.call_id = c.call_id
+                    WHERE cu.phone_number = u.contact_number
+                    ORDER BY c.created_time DESC
+                    LIMIT 1
+                ) AS summary
+            FROM {self.table_name} u
+            WHERE u.contact_number = ANY($1::text[])
+        """
+        
+        with self.db_client.transaction(conn) as conn, conn.cursor() as cur:
+            execute_prepared(cur, "get_contacts", sql_query, (list(contact_numbers),))
+            results = [dict(zip(CONTACT_SUMMARY_FIELDS, row)) for row in cur]
+        
+        logger.debug("Found %d of %d requested customers", len(results), len(contact_numbers))
+        return {result['contact_number']: result for result in results}
 
-    def get_customer_by_contact(self, contact_number: str) -> Optional[Dict[str, Any]]:
+    def get_customer_by_contact(
+        self,
+        contact_number: str,
+        conn: Optional[Connection] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get customer information by contact number
         
         Args:
             contact_number: Contact phone number to search
+            conn: Connection of an ongoing transaction to join (optional)
         
         Returns:
             Dictionary containing customer info or None if not found
         """
-        conn = None
-        try:
-            # Create a new connection for this operation
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database")
-
-            # Retrieves the contact details with summary from the previous conversation
-            sql_query = f"""
-                SELECT 
-                    u.id,
-                    u.customer_name,
-                    u.contact_number,
-                    u.date,
-                    u.created_at,
-                    u.updated_at,
-                    s.summary
-                FROM {self.table_name} u
-                LEFT JOIN customers cu 
-                    ON cu.phone_number = u.contact_number
-                LEFT JOIN calls c 
-                    ON c.customer_id = cu.customer_id
-                LEFT JOIN summaries s 
-                    ON s.call_id = c.call_id
-                WHERE u.contact_number = %s
-                ORDER BY c.created_time DESC
-            """
-            
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql_query, (contact_number,))
-                result = cur.fetchone()
-            
-            if not result:
-                logger.info(f"No customer found with contact number: {contact_number}")
-                return None
-            
-            logger.info(f"Found customer: {result['customer_name']}")
-            return dict(result)
-        
-        except psycopg2.Error as e:
-            error_message = (
-                f"Database error while fetching customer by contact {contact_number}: {str(e)}"
-            )
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
+        result = self.get_customers_by_contacts([contact_number], conn=conn).get(contact_number)
         
-        except Exception as e:
-            logger.error(f"Failed to get customer info: {str(e)}")
-            raise
+        if not result:
+            logger.debug("No customer found with contact number: %s", contact_number)
+            return None
         
-        finally:
-            # Always close the connection
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after get operation")
+        logger.debug("Found customer: %s", result['customer_name'])
+        return result
     
-    def get_customer_name(self, contact_number: str) -> Optional[str]:
+    @db_errors("get_customer_name")
+    def get_customer_name(self, contact_number: str, conn: Optional[Connection] = None) -> Optional[str]:
         """
-        Get customer name by contact number
+        Get customer name by contact number. Results, including misses, are cached
+        for CUSTOMER_NAME_CACHE_TTL seconds and dropped when the contact is written.
         
         Args:
             contact_number: Contact phone number to search
+            conn: Connection of an ongoing transaction to join (optional)
         
         Returns:
             Customer name or None if not found
         """
-        customer = self.get_customer_by_contact(contact_number)
-        return customer.get('customer_name') if customer else None
+        customer_name = self._name_cache.get(contact_number)
+        if customer_name is not MISSING:
+            return customer_name
 
-    def get_all_contacts(self) -> List[Dict[str, Any]]:
+        # Only the name is needed, so skip the summary lookup of get_customer_by_contact
+        sql_query = f"""
+            SELECT customer_name
+            FROM {self.table_name}
+            WHERE contact_number = $1
+            LIMIT 1
         """
-        Get all contact information from the database
-        
-        Returns:
-            List of dictionaries containing all contact records
+
+        with self.db_client.transaction(conn) as conn, conn.cursor() as cur:
+            execute_prepared(cur, "get_customer_name", sql_query, (contact_number,))
+            result = cur.fetchone()
+
+        customer_name = result[0] if result else None
+        self._name_cache.set(contact_number, customer_name)
+        return customer_name
+
+    @db_errors("get_all_contacts")
+    def get_all_contacts(self, conn: Optional[Connection] = None) -> Iterator[Dict[str, Any]]:
         """
-        conn = None
-        try:
-            # Create a new connection for this operation
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database")
+        Stream all contact information from the database.
 
-            sql_query = f"""
-                SELECT id,
-                       customer_name,
-                       contact_number,
-                       date,
-                       created_at,
-                       updated_at
-                FROM {self.table_name}
-                ORDER BY created_at DESC;
-            """
-            
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql_query)
-                results = cur.fetchall()
-            
-            logger.info(f"Retrieved {len(results)} contacts")
-            return [dict(row) for row in results]
-        
-        except psycopg2.Error as e:
-            error_message = f"Database error while fetching all contacts: {str(e)}"
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
+        Rows are read through a server-side cursor, CONTACTS_STREAM_ITERSIZE at a
+        time, and the pooled connection is held until the generator is exhausted
+        or closed. Callers needing a list should wrap the result in list().
+
+        Args:
+            conn: Connection of an ongoing transaction to join (optional)
         
-        except Exception as e:
-            logger.error(f"Failed to get all contacts: {str(e)}")
-            raise
+        Returns:
+            Iterator of dictionaries containing the contact records
+        """
+        sql_query = f"""
+            SELECT id,
+                   customer_name,
+                   contact_number,
+                   date,
+                   created_at,
+                   updated_at
+            FROM {self.table_name}
+            ORDER BY created_at DESC
+        """
         
-        finally:
-            # Always close the connection
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after get all operation")
+        # Named cursors are declared server-side, so this query cannot go through EXECUTE
+        with self.db_client.transaction(conn) as conn, conn.cursor(name="contacts_stream") as cur:
+            cur.itersize = CONTACTS_STREAM_ITERSIZE
+            cur.execute(sql_query)
+
+            count = 0
+            for row in cur:
+                count += 1
+                yield dict(zip(CONTACT_FIELDS, row))
 
+        logger.info("Retrieved %d contacts", count)
+
+    @db_errors(
+        "update_contact_by_phone",
+        already_exists=lambda self, contact_number, *args, **kwargs: ContactAlreadyExistsException(
+            detail=f"New phone number for {contact_number} already belongs to another contact"
+        )
+    )
     def update_contact_by_phone(
         self, 
         contact_number: str, 
         customer_name: Optional[str] = None,
         new_contact_number: Optional[str] = None,
-        date: Optional[datetime] = None
+        date: Optional[datetime] = None,
+        conn: Optional[Connection] = None
     ) -> bool:
         """
         Update contact information by phone number
@@ -341,162 +454,116 @@ class ContactInfoService(metaclass=SingletonMeta):
             customer_name: New customer name (optional)
             new_contact_number: New phone number (optional)
             date: New date (optional)
+            conn: Connection of an ongoing transaction to join (optional)
         
         Returns:
             True if updated successfully, False otherwise
         """
-        conn = None
-        try:
-            # Build update data with only provided fields
-            update_fields = []
-            values = []
-            
-            if customer_name is not None:
-                update_fields.append("customer_name = %s")
-                values.append(customer_name)
-            if new_contact_number is not None:
-                update_fields.append("contact_number = %s")
-                values.append(new_contact_number)
-            if date is not None:
-                update_fields.append("date = %s")
-                values.append(date)
-            
-            if not update_fields:
-                logger.warning(f"No update data provided for {contact_number}")
-                return False
+        # Keep only the provided fields
+        provided = [
+            (column, value)
+            for column, value in (
+                ("customer_name", customer_name),
+                ("contact_number", new_contact_number),
+                ("date", date),
+            )
+            if value is not None
+        ]
+        
+        if not provided:
+            logger.warning("No update data provided for %s", contact_number)
+            return False
+        
+        columns = tuple(column for column, _ in provided)
+        
+        # Add phone number for WHERE clause
+        values = [value for _, value in provided] + [contact_number]
+        
+        # At most 7 column combinations exist, so each statement is built once
+        sql_query = self._update_queries.get(columns)
+        if sql_query is None:
+            update_fields = [f"{column} = ${index}" for index, column in enumerate(columns, start=1)]
             
             # Add updated_at timestamp
             update_fields.append("updated_at = CURRENT_TIMESTAMP")
             
-            # Add phone number for WHERE clause
-            values.append(contact_number)
-            
-            # Create a new connection for this operation
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database")
-
             sql_query = f"""
                 UPDATE {self.table_name}
                 SET {', '.join(update_fields)}
-                WHERE contact_number = %s
-                RETURNING id;
+                WHERE contact_number = ${len(columns) + 1}
+                RETURNING id
             """
-            
-            with conn.cursor() as cur:
-                cur.execute(sql_query, tuple(values))
-                result = cur.fetchone()
-            
-            conn.commit()
-            
+            self._update_queries[columns] = sql_query
+        
+        with self.db_client.transaction(conn) as tx_conn, tx_conn.cursor() as cur:
+            execute_prepared(cur, f"update_contact_{'_'.join(columns)}", sql_query, values)
+            result = cur.fetchone()
+
             if not result:
                 raise ContactNotFoundException(
                     detail=f"No contact found to update for: {contact_number}"
                 )
-            
-            logger.info(f"Contact updated successfully for: {contact_number}")
-            return True
-        
-        except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
-            error_message = f"Database error while updating contact: {str(e)}"
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
-        
-        except ContactNotFoundException:
-            if conn:
-                conn.rollback()
-            raise
-        
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Failed to update contact: {str(e)}")
-            raise
         
-        finally:
-            # Always close the connection
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after update operation")
+        changed_numbers = [contact_number]
+        if new_contact_number is not None:
+            changed_numbers.append(new_contact_number)
+        self._invalidate_names(conn, changed_numbers)
+        logger.info("Contact updated successfully for: %s", contact_number)
+        return True
 
-    def delete_contact_by_phone(self, contact_number: str) -> bool:
+    @db_errors("delete_contact_by_phone")
+    def delete_contact_by_phone(self, contact_number: str, conn: Optional[Connection] = None) -> bool:
         """
         Delete contact information by phone number and cascade delete associated appointments
         
         Args:
             contact_number: Contact phone number to delete
+            conn: Connection of an ongoing transaction to join (optional)
         
         Returns:
             True if deleted successfully, False otherwise
         """
-        conn = None
-        try:
-            # Create a new connection for this operation
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database")
-
-            # First, delete associated appointments
-            delete_appointments_query = f"""
-                DELETE FROM {APPOINTMENTS_TABLE_NAME}
-                WHERE customer_phone_number = %s;
-            """
-            
-            # Then delete the contact
-            delete_contact_query = f"""
-                DELETE FROM {self.table_name}
-                WHERE contact_number = %s
-                RETURNING id;
-            """
-            
-            with conn.cursor() as cur:
-                # Delete appointments first
-                cur.execute(delete_appointments_query, (contact_number,))
-                deleted_appointments = cur.rowcount
-                
-                # Then delete contact
-                cur.execute(delete_contact_query, (contact_number,))
-                result = cur.fetchone()
-            
-            conn.commit()
+        # First, delete associated appointments
+        delete_appointments_query = f"""
+            DELETE FROM {APPOINTMENTS_TABLE_NAME}
+            WHERE customer_phone_number = $1
+        """
+        
+        # Then delete the contact
+        delete_contact_query = f"""
+            DELETE FROM {self.table_name}
+            WHERE contact_number = $1
+            RETURNING id
+        """
+        
+        # Both deletes share one transaction
+        with self.db_client.transaction(conn) as tx_conn, tx_conn.cursor() as cur:
+            # Delete appointments first
+            execute_prepared(cur, "del_contact_appointments", delete_appointments_query, (contact_number,))
+            deleted_appointments = cur.rowcount
             
+            # Then delete contact
+            execute_prepared(cur, "del_contact", delete_contact_query, (contact_number,))
+            result = cur.fetchone()
+
             if not result:
                 raise ContactNotFoundException(
                     detail=f"No contact found to delete for: {contact_number}"
                 )
-            
-            logger.info(
-                f"Contact deleted successfully for: {contact_number}. "
-                f"Also deleted {deleted_appointments} associated appointment(s)"
-            )
-            return True
-        
-        except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
-            error_message = f"Database error while deleting contact: {str(e)}"
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
-        
-        except ContactNotFoundException:
-            if conn:
-                conn.rollback()
-            raise
         
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Failed to delete contact: {str(e)}")
-            raise
-        
-        finally:
-            # Always close the connection
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed after delete operation")
+        self._invalidate_names(conn, (contact_number,))
+        logger.info(
+            "Contact deleted successfully for: %s. Also deleted %d associated appointment(s)",
+            contact_number,
+            deleted_appointments
+        )
+        return True
 
 
-# Create singleton instance
-contact_service = ContactInfoService()
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_contact_service() -> ContactInfoService:
+    """
+    Return the shared ContactInfoService, creating it (and its table) on first use
+    instead of at import time. main.py calls it at startup.
+    """
+    return ContactInfoService()
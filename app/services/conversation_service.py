@@ -1,140 +1,387 @@
-import json
+import base64
+import csv
+import functools
+import hashlib
+import io
 import logging
 import math
-from datetime import time, timedelta
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import orjson
 import psycopg2
-from psycopg2.errors import UniqueViolation
-from psycopg2.extras import RealDictCursor
+from pydantic import BaseModel, TypeAdapter
+from psycopg2.extras import Json, execute_values
 
 from app.exceptions.conversation.conversation_exception import (
-    ConversationAlreadyExistsException
+    ConversationAlreadyExistsException,
+    InvalidConversationCursorException
 )
-from app.exceptions.database.database_connection_exception import DatabaseConnectionException
 from app.exceptions.database.database_initialization_exception import DatabaseInitializationException
-from app.models.conversation.customer_data_model import (
-    CustomerDataModel,
-    CallDataModel,
-    VehicleDataModel,
-    ConversationSummaryModel,
-    SentimentDataModel
-)
 from app.models.conversation.customer_data_request_model import CustomerDataRequestModel
 from app.models.conversation.customer_data_response_model import (
     CustomerDataResponseModel,
     MetadataModel
 )
 from app.models.enum.response_status import ResponseStatus
-from app.services.db_service import PostgresClient
+from app.services._db_errors import db_errors
+from app.services._ttl_cache import MISSING, TTLCache
+from app.services.db_service import PostgresClient, execute_prepared
+from config import DB_INIT_SCHEMA
 from singleton import SingletonMeta
 
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Rows per multi-VALUES INSERT statement for bulk saves
+BULK_PAGE_SIZE = 1000
+
+# Batches larger than this are loaded with COPY instead of INSERT ... VALUES
+BULK_COPY_THRESHOLD = 10_000
+
+# Marks a NULL field in COPY CSV data; quoted like every other string, so an empty
+# string stays distinguishable from NULL
+COPY_NULL = r"\N"
+
+# Seconds the total number of calls is reused across page requests
+TOTAL_ITEMS_CACHE_TTL = 60
+
+# Call count above which the page total comes from pg_class.reltuples instead of COUNT(*)
+TOTAL_ITEMS_ESTIMATE_THRESHOLD = 100_000
+
+# Conversation tables, types and indexes, created by ConversationService._initialize_db
+SCHEMA_SQL = """
+    -- 1. Create the ENUM type for customer status, ignoring an existing one
+    DO $$
+    BEGIN
+        CREATE TYPE cust_type AS ENUM ('New Customer', 'Returning Customer');
+    EXCEPTION
+        WHEN duplicate_object THEN NULL;
+    END$$;
+
+    -- 2. Create the customers table
+    CREATE TABLE IF NOT EXISTS customers (
+        customer_id SERIAL PRIMARY KEY,
+        phone_number VARCHAR(25) UNIQUE NOT NULL,
+        first_name VARCHAR(100),
+        customer_type cust_type DEFAULT 'New Customer'
+    );
+
+    -- 3. Create the calls table
+    CREATE TABLE IF NOT EXISTS calls (
+        call_id SERIAL PRIMARY KEY,
+        customer_id INTEGER REFERENCES customers(customer_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        created_time TIMESTAMPTZ,
+        sid VARCHAR(100) UNIQUE,
+        call_duration INTERVAL,
+        artifacts JSONB,
+        live_agent_transfer BOOLEAN,
+        abandoned BOOLEAN,
+        elead BOOLEAN
+    );
+
+    -- 4. Create the vehicles table
+    CREATE TABLE IF NOT EXISTS vehicles (
+        vehicle_id SERIAL PRIMARY KEY,
+        call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        vehicle VARCHAR(100),
+        model VARCHAR(100),
+        requirements JSONB
+    );
+
+    -- 5. NEW: Create the summaries table
+    CREATE TABLE IF NOT EXISTS summaries (
+        summary_id SERIAL PRIMARY KEY,
+        call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        summary TEXT NOT NULL,
+        intent TEXT NOT NULL,
+        resolution TEXT NOT NULL,
+        escalation TEXT,
+        next_steps TEXT,
+        flags JSONB,
+        tags JSONB,
+        average_handle_time JSONB
+    );
+
+    -- 6. NEW: Create the sentiments table
+    CREATE TABLE IF NOT EXISTS sentiments (
+        sentiment_id SERIAL PRIMARY KEY,
+        call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED,
+        score NUMERIC(5, 2),
+        tone_summary TEXT,
+        ai_interpretation TEXT,
+        emotion_breakdown JSONB,
+        key_phrases JSONB
+    );
+
+    -- 7. Create indexes for faster lookups
+    CREATE INDEX IF NOT EXISTS idx_calls_customer_id ON calls (customer_id);
+    CREATE INDEX IF NOT EXISTS idx_calls_created_id ON calls (created_time DESC, call_id DESC);
+
+    -- Vacuum calls more often to keep the visibility map fresh for index-only scans
+    ALTER TABLE calls SET (autovacuum_vacuum_scale_factor = 0.05);
+
+    -- vehicles/summaries/sentiments.call_id are UNIQUE columns, whose implicit
+    -- index already serves lookups; drop the duplicates older schemas created
+    DROP INDEX IF EXISTS idx_vehicles_call_id;
+    DROP INDEX IF EXISTS idx_summaries_call_id;
+    DROP INDEX IF EXISTS idx_sentiments_call_id;
+
+    -- 8. Check foreign keys once at commit instead of after every insert;
+    -- also applied to tables created before the keys were deferrable
+    ALTER TABLE calls ALTER CONSTRAINT calls_customer_id_fkey DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE vehicles ALTER CONSTRAINT vehicles_call_id_fkey DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE summaries ALTER CONSTRAINT summaries_call_id_fkey DEFERRABLE INITIALLY DEFERRED;
+    ALTER TABLE sentiments ALTER CONSTRAINT sentiments_call_id_fkey DEFERRABLE INITIALLY DEFERRED;
+"""
+
+# Changes whenever SCHEMA_SQL does, so an edited schema is applied on the next start
+SCHEMA_VERSION = hashlib.sha256(SCHEMA_SQL.encode()).hexdigest()[:16]
+
+# Saves one call with its customer, summary, sentiment and optional vehicle in a
+# single statement. A known customer with unchanged details is only read, so the
+# upsert (and the row lock it takes) is reserved for new or changed customers.
+SAVE_CONVERSATION_SQL = """
+    WITH known_customer AS (
+        SELECT customer_id FROM customers
+        WHERE phone_number = $1
+          AND first_name IS NOT DISTINCT FROM $2
+          AND customer_type = $3
+    ),
+    ins_customer AS (
+        INSERT INTO customers (phone_number, first_name, customer_type)
+        SELECT $1, $2, $3
+        WHERE NOT EXISTS (SELECT 1 FROM known_customer)
+        ON CONFLICT (phone_number) DO UPDATE SET
+            first_name = EXCLUDED.first_name,
+            customer_type = EXCLUDED.customer_type
+        WHERE customers.first_name IS DISTINCT FROM EXCLUDED.first_name
+           OR customers.customer_type IS DISTINCT FROM EXCLUDED.customer_type
+        RETURNING customer_id
+    ),
+    customer AS (
+        SELECT customer_id FROM known_customer
+        UNION ALL
+        SELECT customer_id FROM ins_customer
+        UNION ALL
+        SELECT customer_id FROM customers WHERE phone_number = $1
+        LIMIT 1
+    ),
+    ins_call AS (
+        INSERT INTO calls (
+            customer_id,
+            created_time,
+            sid,
+            call_duration,
+            artifacts,
+            live_agent_transfer,
+            abandoned,
+            elead
+        )
+        SELECT customer_id, $4::timestamptz, $5::varchar, $6::interval, $7::jsonb,
+               $8::boolean, $9::boolean, $10::boolean
+        FROM customer
+        RETURNING call_id, customer_id
+    ),
+    ins_summary AS (
+        INSERT INTO summaries (
+            call_id,
+            summary,
+            intent,
+            resolution,
+            escalation,
+            next_steps,
+            flags,
+            tags,
+            average_handle_time
+        )
+        SELECT call_id, $11::text, $12::text, $13::text, $14::text, $15::text,
+               $16::jsonb, $17::jsonb, $18::jsonb
+        FROM ins_call
+    ),
+    ins_sentiment AS (
+        INSERT INTO sentiments (
+            call_id,
+            score,
+            tone_summary,
+            ai_interpretation,
+            emotion_breakdown,
+            key_phrases
+        )
+        SELECT call_id, $19::numeric, $20::text, $21::text, $22::jsonb, $23::jsonb
+        FROM ins_call
+    ),
+    ins_vehicle AS (
+        INSERT INTO vehicles (call_id, vehicle, model, requirements)
+        SELECT call_id, $25::varchar, $26::varchar, $27::jsonb
+        FROM ins_call
+        WHERE $24::boolean
+    )
+    SELECT customer_id, call_id FROM ins_call
+"""
+
+# One call shaped into the CustomerDataRequestModel layout, over the aliases of CONVERSATION_JOINS_SQL
+CONVERSATION_PAYLOAD_SQL = """
+            jsonb_build_object(
+                'customer_data', jsonb_build_object(
+                    'first_name', c.first_name,
+                    'phone_number', c.phone_number,
+                    'customer_type', c.customer_type
+                ),
+                'call_data', jsonb_build_object(
+                    'created_time', cl.created_time,
+                    'sid', cl.sid,
+                    -- Adding the interval to midnight wraps durations into a time of day
+                    'duration', to_char(TIME '00:00' + cl.call_duration, 'HH24:MI:SS'),
+                    'artifacts', COALESCE(cl.artifacts, '[]'::jsonb),
+                    'live_agent_transfer', cl.live_agent_transfer,
+                    'abandoned', cl.abandoned,
+                    'e_lead', cl.elead
+                ),
+                'vehicle_data', jsonb_build_object(
+                    'vehicle', v.vehicle,
+                    'model', v.model,
+                    'requirements', COALESCE(v.requirements, '[]'::jsonb)
+                ),
+                'summary_data', jsonb_build_object(
+                    'summary', s.summary,
+                    'intent', s.intent,
+                    'resolution', s.resolution,
+                    'escalation', COALESCE(s.escalation, ''),
+                    'next_steps', s.next_steps,
+                    'flags', COALESCE(s.flags, '[]'::jsonb),
+                    'tags', COALESCE(s.tags, '[]'::jsonb),
+                    'average_handle_time', COALESCE(s.average_handle_time, '[]'::jsonb)
+                ),
+                'sentiment_data', jsonb_build_object(
+                    'score', se.score,
+                    'tone_summary', se.tone_summary,
+                    'ai_interpretation', se.ai_interpretation,
+                    'emotion_breakdown', COALESCE(se.emotion_breakdown, '[]'::jsonb),
+                    'key_phrases', COALESCE(se.key_phrases, '[]'::jsonb)
+                )
+            )
+"""
+
+# Joins a `calls cl` row to its customer, vehicle, summary and sentiment
+CONVERSATION_JOINS_SQL = """
+                 JOIN
+             customers c ON cl.customer_id = c.customer_id
+                 LEFT JOIN LATERAL
+             (SELECT * FROM vehicles WHERE call_id = cl.call_id) v ON true
+                 LEFT JOIN LATERAL
+             (SELECT * FROM summaries WHERE call_id = cl.call_id) s ON true
+                 LEFT JOIN LATERAL
+             (SELECT * FROM sentiments WHERE call_id = cl.call_id) se ON true
+"""
+
+# Rows fetched per round trip when streaming conversations
+STREAM_ITERSIZE = 200
+
+# Validates a whole page of conversation payloads in one pydantic-core call
+_CONVERSATIONS_ADAPTER = TypeAdapter(List[CustomerDataRequestModel])
+
+
+def _json_default(value: Any) -> Any:
+    """Let orjson serialize pydantic models (e.g. call artifacts)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _to_json(value: Any) -> str:
+    """Serialize a value bound for a JSONB column"""
+    return orjson.dumps(value, default=_json_default).decode()
+
+
+class FastJson(Json):
+    """psycopg2 Json adapter encoding with orjson, for JSONB query parameters"""
+
+    def dumps(self, obj: Any) -> str:
+        return _to_json(obj)
+
+
+def _copy_rows(cur, table: str, columns: str, rows) -> None:
+    """
+    Stream rows into `table` with COPY ... FROM STDIN in CSV format.
+    Every string is quoted, so empty strings stay empty instead of becoming NULL.
+    None is written as COPY_NULL, which FORCE_NULL loads as NULL even though it is
+    quoted, so COPY stores the same values as the execute_values path.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC).writerows(
+        [COPY_NULL if value is None else value for value in row] for row in rows
+    )
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY {table} ({columns}) FROM STDIN "
+        f"WITH (FORMAT csv, NULL '{COPY_NULL}', FORCE_NULL ({columns}))",
+        buffer
+    )
+
+
+def _encode_cursor(created_time: datetime, call_id: int) -> str:
+    """Build the opaque keyset cursor pointing after the given call"""
+    return base64.urlsafe_b64encode(f"{created_time.isoformat()}|{call_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Read back the (created_time, call_id) position encoded by _encode_cursor"""
+    try:
+        created_time, call_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_time), int(call_id)
+    except ValueError:
+        raise InvalidConversationCursorException(detail=f"Invalid pagination cursor: {cursor}")
+
 
 class ConversationService(metaclass=SingletonMeta):
     def __init__(self):
         """
         Initializes the ConversationService and its database client.
         The PostgresClient is assumed to manage its own connection pool.
+        The schema is only applied when DB_INIT_SCHEMA is set, so deployments that
+        migrate the database beforehand skip it.
         """
         self.db_client = PostgresClient()
-        self._initialize_db()
+        self._total_items_cache = TTLCache(maxsize=1, ttl=TOTAL_ITEMS_CACHE_TTL)
+        if DB_INIT_SCHEMA:
+            self._initialize_db()
 
     def _initialize_db(self):
         """
         Creates all necessary tables, types, and indexes if they don't already exist.
         This schema is designed to match the CustomerDataRequestModel.
+
+        SCHEMA_SQL only runs when its SCHEMA_VERSION is not yet recorded in schema_version.
         """
-        conn = None
         try:
             logger.info("Initializing database schema for conversations...")
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseInitializationException(
-                    detail="Failed to connect to DB."
-                )
 
-            schema_sql = """
-            -- 1. Create the ENUM type for customer status
-            DO $$
-            BEGIN
-                IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'cust_type') THEN
-                    CREATE TYPE cust_type AS ENUM ('New Customer', 'Returning Customer');
-                END IF;
-            END$$;
-
-            -- 2. Create the customers table
-            CREATE TABLE IF NOT EXISTS customers (
-                customer_id SERIAL PRIMARY KEY,
-                phone_number VARCHAR(25) UNIQUE NOT NULL,
-                first_name VARCHAR(100),
-                customer_type cust_type DEFAULT 'New Customer'
-            );
-
-            -- 3. Create the calls table
-            CREATE TABLE IF NOT EXISTS calls (
-                call_id SERIAL PRIMARY KEY,
-                customer_id INTEGER REFERENCES customers(customer_id) ON DELETE CASCADE,
-                created_time TIMESTAMPTZ,
-                sid VARCHAR(100) UNIQUE,
-                call_duration INTERVAL,
-                artifacts JSONB,
-                live_agent_transfer BOOLEAN,
-                abandoned BOOLEAN,
-                elead BOOLEAN
-            );
-
-            -- 4. Create the vehicles table
-            CREATE TABLE IF NOT EXISTS vehicles (
-                vehicle_id SERIAL PRIMARY KEY,
-                call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE,
-                vehicle VARCHAR(100),
-                model VARCHAR(100),
-                requirements JSONB
-            );
-
-            -- 5. NEW: Create the summaries table
-            CREATE TABLE IF NOT EXISTS summaries (
-                summary_id SERIAL PRIMARY KEY,
-                call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE,
-                summary TEXT NOT NULL,
-                intent TEXT NOT NULL,
-                resolution TEXT NOT NULL,
-                escalation TEXT,
-                next_steps TEXT,
-                flags JSONB,
-                tags JSONB,
-                average_handle_time JSONB
-            );
-
-            -- 6. NEW: Create the sentiments table
-            CREATE TABLE IF NOT EXISTS sentiments (
-                sentiment_id SERIAL PRIMARY KEY,
-                call_id INTEGER UNIQUE REFERENCES calls(call_id) ON DELETE CASCADE,
-                score NUMERIC(5, 2),
-                tone_summary TEXT,
-                ai_interpretation TEXT,
-                emotion_breakdown JSONB,
-                key_phrases JSONB
-            );
-
-            -- 7. Create indexes for faster lookups
-            CREATE INDEX IF NOT EXISTS idx_calls_customer_id ON calls (customer_id);
-            CREATE INDEX IF NOT EXISTS idx_vehicles_call_id ON vehicles (call_id);
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_summaries_call_id ON summaries (call_id);
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_sentiments_call_id ON sentiments (call_id);
-            """
-
-            with conn.cursor() as cur:
-                cur.execute(schema_sql)
-            conn.commit()
+            with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_version (
+                        version VARCHAR(16) PRIMARY KEY,
+                        applied_at TIMESTAMPTZ DEFAULT now()
+                    );
+                """)
+                cur.execute("SELECT 1 FROM schema_version WHERE version = %s;", (SCHEMA_VERSION,))
+                if cur.fetchone() is not None:
+                    logger.info("Database schema %s is already applied.", SCHEMA_VERSION)
+                    return
+
+                # Serialize workers starting together; the first one applies the schema
+                cur.execute("LOCK TABLE schema_version IN EXCLUSIVE MODE;")
+                cur.execute("SELECT 1 FROM schema_version WHERE version = %s;", (SCHEMA_VERSION,))
+                if cur.fetchone() is None:
+                    cur.execute(SCHEMA_SQL)
+                    cur.execute(
+                        "INSERT INTO schema_version (version) VALUES (%s) ON CONFLICT DO NOTHING;",
+                        (SCHEMA_VERSION,)
+                    )
             logger.info("Database schema is ready.")
 
         except psycopg2.Error as e:
-            if conn:
-                conn.rollback()
             error_message = f'Error while creating tables for conversations: {str(e)}'
             logger.error(error_message)
             raise DatabaseInitializationException(detail=error_message)
@@ -144,27 +391,12 @@ class ConversationService(metaclass=SingletonMeta):
             logger.error(error_message)
             raise DatabaseInitializationException(detail=error_message)
 
-        finally:
-            if conn:
-                self.db_client.close()
-
-    @staticmethod
-    def _convert_interval_to_time(interval: timedelta) -> time:
-        """
-        Convert a timedelta (INTERVAL) to a time object.
-
-        Args:
-            interval: timedelta object from database
-
-        Returns:
-            time object representing duration
-        """
-        total_seconds = int(interval.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        return time(hour=hours % 24, minute=minutes, second=seconds)
-
+    @db_errors(
+        "save_conversation_data",
+        already_exists=lambda self, request: ConversationAlreadyExistsException(
+            detail=f"Call with SID {request.call_data.sid} already exists.",
+        )
+    )
     def save_conversation_data(self, request: CustomerDataRequestModel) -> int:
         """
         Logs a complete call as a single transaction from a CustomerDataRequestModel.
@@ -172,8 +404,6 @@ class ConversationService(metaclass=SingletonMeta):
         Args:
             request (CustomerDataRequestModel): The complete request data.
         """
-        conn = None
-
         # Extract data from the request model
         customer_data = request.customer_data
         call_data = request.call_data
@@ -181,327 +411,530 @@ class ConversationService(metaclass=SingletonMeta):
         sentiment_data = request.sentiment_data
         vehicle_data = request.vehicle_data
 
-        try:
-            logger.info(f'Started logging call details for SID: {call_data.sid}')
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            with conn.cursor() as cur:
-                # Insert/Update Customer
-                sql_customer = """
-                   INSERT INTO customers (phone_number, first_name, customer_type)
-                   VALUES (%s, %s, %s) ON CONFLICT (phone_number) DO \
-                   UPDATE SET
-                       first_name = EXCLUDED.first_name, \
-                       customer_type = EXCLUDED.customer_type \
-                       RETURNING customer_id; \
-                               """
-                cur.execute(sql_customer, (
-                    customer_data.phone_number,
-                    customer_data.first_name,
-                    customer_data.customer_type.value
-                ))
-                customer_id = cur.fetchone()[0]
-                logger.debug(f"Processed customer_id: {customer_id}")
-
-                # Insert Call
-                sql_call = """
-                   INSERT INTO calls (
-                       customer_id, \
-                       created_time, \
-                       sid, \
-                       call_duration, \
-                       artifacts, \
-                       live_agent_transfer, \
-                       abandoned, \
-                       elead
-                   )
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING call_id; \
-                           """
-                artifacts_json = json.dumps([artifact.model_dump() for artifact in call_data.artifacts])
-
-                cur.execute(sql_call, (
-                    customer_id,
-                    call_data.created_time,
-                    call_data.sid,
-                    call_data.duration.isoformat(),  # Convert time to string for INTERVAL
-                    artifacts_json,
-                    call_data.live_agent_transfer,
-                    call_data.abandoned,
-                    call_data.e_lead
-                ))
-                call_id = cur.fetchone()[0]
-                logger.debug(f"Logged call_id: {call_id}")
-
-                # Insert Summary
-                sql_summary = """
-                  INSERT INTO summaries (
-                      call_id, \
-                      summary, \
-                      intent, \
-                      resolution, \
-                      escalation, \
-                      next_steps, \
-                      flags, \
-                      tags, \
-                      average_handle_time
-                  )
-                  VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s); \
-                              """
-                cur.execute(sql_summary, (
-                    call_id,
-                    summary_data.summary,
-                    summary_data.intent,
-                    summary_data.resolution,
-                    summary_data.escalation,
-                    summary_data.next_steps,
-                    json.dumps(summary_data.flags),
-                    json.dumps(summary_data.tags),
-                    json.dumps(summary_data.average_handle_time)
-                ))
-
-                # Insert Sentiment
-                sql_sentiment = """
-                    INSERT INTO sentiments (
-                        call_id, \
-                        score, \
-                        tone_summary, \
-                        ai_interpretation, \
-                        emotion_breakdown, \
-                        key_phrases
+        logger.info("Started logging call details for SID: %s", call_data.sid)
+
+        params = (
+            customer_data.phone_number,
+            customer_data.first_name,
+            customer_data.customer_type.value,
+            call_data.created_time,
+            call_data.sid,
+            call_data.duration.isoformat(),  # Convert time to string for INTERVAL
+            FastJson(call_data.artifacts),
+            call_data.live_agent_transfer,
+            call_data.abandoned,
+            call_data.e_lead,
+            summary_data.summary,
+            summary_data.intent,
+            summary_data.resolution,
+            summary_data.escalation,
+            summary_data.next_steps,
+            FastJson(summary_data.flags),
+            FastJson(summary_data.tags),
+            FastJson(summary_data.average_handle_time),
+            sentiment_data.score,
+            sentiment_data.tone_summary,
+            sentiment_data.ai_interpretation,
+            FastJson(sentiment_data.emotion_breakdown),
+            FastJson(sentiment_data.key_phrases),
+            vehicle_data is not None,
+            vehicle_data.vehicle if vehicle_data else None,
+            vehicle_data.model if vehicle_data else None,
+            FastJson(vehicle_data.requirements) if vehicle_data else None
+        )
+
+        # Every insert runs in one round trip through a statement prepared once per
+        # pooled connection
+        with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
+            execute_prepared(cur, "save_conversation", SAVE_CONVERSATION_SQL, params)
+            row = cur.fetchone()
+            if row is None:
+                # The conflicting customer was committed after this statement's snapshot
+                # was taken, so nothing was inserted; a fresh statement sees it
+                execute_prepared(cur, "save_conversation", SAVE_CONVERSATION_SQL, params)
+                row = cur.fetchone()
+            customer_id, call_id = row
+            logger.debug("Logged call_id: %s for customer_id: %s", call_id, customer_id)
+
+        self._total_items_cache.pop("calls")
+        logger.info("Successfully committed all data for SID: %s", call_data.sid)
+
+        return customer_id
+
+    @db_errors(
+        "save_conversation_data_bulk",
+        already_exists=lambda self, requests: ConversationAlreadyExistsException(
+            detail="One or more calls in the batch already exist.",
+        )
+    )
+    def save_conversation_data_bulk(self, requests: List[CustomerDataRequestModel]) -> List[int]:
+        """
+        Logs many calls in a single transaction, with one multi-row INSERT per table
+        (BULK_PAGE_SIZE rows per statement) instead of five statements per call.
+        Batches above BULK_COPY_THRESHOLD are streamed with COPY instead.
+
+        Args:
+            requests (List[CustomerDataRequestModel]): The calls to save.
+
+        Returns:
+            The customer ID of each request, in request order.
+        """
+        if not requests:
+            return []
+
+        logger.info("Started logging %d calls in bulk", len(requests))
+
+        # Keep the last customer data per phone number, a single upsert cannot touch a row twice
+        customer_rows = {
+            request.customer_data.phone_number: (
+                request.customer_data.phone_number,
+                request.customer_data.first_name,
+                request.customer_data.customer_type.value
+            )
+            for request in requests
+        }
+
+        with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
+            if len(requests) > BULK_COPY_THRESHOLD:
+                customer_ids = self._copy_conversation_data(cur, requests, list(customer_rows.values()))
+            else:
+                # Insert/Update Customers
+                customer_ids = {
+                    phone_number: customer_id for customer_id, phone_number in execute_values(
+                        cur,
+                        """
+                        INSERT INTO customers (phone_number, first_name, customer_type)
+                        VALUES %s
+                        ON CONFLICT (phone_number) DO UPDATE SET
+                            first_name = EXCLUDED.first_name,
+                            customer_type = EXCLUDED.customer_type
+                        RETURNING customer_id, phone_number;
+                        """,
+                        list(customer_rows.values()),
+                        template="(%s, %s, %s::cust_type)",
+                        page_size=BULK_PAGE_SIZE,
+                        fetch=True
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s); \
+                }
+
+                # Insert Calls
+                call_ids = {
+                    sid: call_id for call_id, sid in execute_values(
+                        cur,
+                        """
+                        INSERT INTO calls (
+                            customer_id,
+                            created_time,
+                            sid,
+                            call_duration,
+                            artifacts,
+                            live_agent_transfer,
+                            abandoned,
+                            elead
+                        )
+                        VALUES %s
+                        RETURNING call_id, sid;
+                        """,
+                        [
+                            (
+                                customer_ids[request.customer_data.phone_number],
+                                request.call_data.created_time,
+                                request.call_data.sid,
+                                request.call_data.duration.isoformat(),
+                                FastJson(request.call_data.artifacts),
+                                request.call_data.live_agent_transfer,
+                                request.call_data.abandoned,
+                                request.call_data.e_lead
+                            )
+                            for request in requests
+                        ],
+                        template="(%s, %s, %s, %s::interval, %s::jsonb, %s, %s, %s)",
+                        page_size=BULK_PAGE_SIZE,
+                        fetch=True
+                    )
+                }
+
+                # Insert Summaries
+                execute_values(
+                    cur,
                     """
-                cur.execute(sql_sentiment, (
-                    call_id,
-                    sentiment_data.score,
-                    sentiment_data.tone_summary,
-                    sentiment_data.ai_interpretation,
-                    json.dumps(sentiment_data.emotion_breakdown),
-                    json.dumps(sentiment_data.key_phrases)
-                ))
-
-                # Insert Vehicle
-                if vehicle_data:
-                    sql_vehicle = """
-                      INSERT INTO vehicles (call_id, \
-                                            vehicle, \
-                                            model, \
-                                            requirements)
-                      VALUES (%s, %s, %s, %s); \
-                                  """
-                    requirements_json = json.dumps(vehicle_data.requirements)
-                    cur.execute(sql_vehicle, (
+                    INSERT INTO summaries (
                         call_id,
-                        vehicle_data.vehicle,
-                        vehicle_data.model,
-                        requirements_json
-                    ))
-                    logger.debug(f"Logged vehicle data for call_id: {call_id}")
-
-            # Commit the transaction
-            conn.commit()
-            logger.info(f"Successfully committed all data for SID: {call_data.sid}")
-
-            return customer_id
-
-        except UniqueViolation as e:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            error_message = f"Error during saving conversation data: {str(e)}"
-            logger.error(error_message)
-            raise ConversationAlreadyExistsException(
-                detail=f"Call with SID {call_data.sid} already exists.",
-            )
-        
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            logger.error(f"Database error saving conversation data: {str(e)}")
-            raise DatabaseConnectionException(
-                detail=f"Database error while saving conversation data: {str(e)}"
-            )
+                        summary,
+                        intent,
+                        resolution,
+                        escalation,
+                        next_steps,
+                        flags,
+                        tags,
+                        average_handle_time
+                    )
+                    VALUES %s;
+                    """,
+                    [
+                        (
+                            call_ids[request.call_data.sid],
+                            request.summary_data.summary,
+                            request.summary_data.intent,
+                            request.summary_data.resolution,
+                            request.summary_data.escalation,
+                            request.summary_data.next_steps,
+                            FastJson(request.summary_data.flags),
+                            FastJson(request.summary_data.tags),
+                            FastJson(request.summary_data.average_handle_time)
+                        )
+                        for request in requests
+                    ],
+                    template="(%s, %s, %s, %s, %s, %s, %s::jsonb, %s::jsonb, %s::jsonb)",
+                    page_size=BULK_PAGE_SIZE
+                )
 
-        except Exception as e:
-            # Rollback the changes
-            if conn:
-                conn.rollback()
-            logger.error(f"Unexpected error in save_conversation_data: {str(e)}")
-            raise
+                # Insert Sentiments
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO sentiments (
+                        call_id,
+                        score,
+                        tone_summary,
+                        ai_interpretation,
+                        emotion_breakdown,
+                        key_phrases
+                    )
+                    VALUES %s;
+                    """,
+                    [
+                        (
+                            call_ids[request.call_data.sid],
+                            request.sentiment_data.score,
+                            request.sentiment_data.tone_summary,
+                            request.sentiment_data.ai_interpretation,
+                            FastJson(request.sentiment_data.emotion_breakdown),
+                            FastJson(request.sentiment_data.key_phrases)
+                        )
+                        for request in requests
+                    ],
+                    template="(%s, %s, %s, %s, %s::jsonb, %s::jsonb)",
+                    page_size=BULK_PAGE_SIZE
+                )
 
-        finally:
-            if conn:
-                conn.close()
+                # Insert Vehicles
+                vehicle_rows = [
+                    (
+                        call_ids[request.call_data.sid],
+                        request.vehicle_data.vehicle,
+                        request.vehicle_data.model,
+                        FastJson(request.vehicle_data.requirements)
+                    )
+                    for request in requests
+                    if request.vehicle_data
+                ]
+                if vehicle_rows:
+                    execute_values(
+                        cur,
+                        """
+                        INSERT INTO vehicles (call_id, vehicle, model, requirements)
+                        VALUES %s;
+                        """,
+                        vehicle_rows,
+                        template="(%s, %s, %s, %s::jsonb)",
+                        page_size=BULK_PAGE_SIZE
+                    )
+
+        self._total_items_cache.pop("calls")
+        logger.info("Successfully committed %d calls in bulk", len(requests))
+
+        return [customer_ids[request.customer_data.phone_number] for request in requests]
 
-    def get_conversation_data(self, page: int, per_page: int) -> CustomerDataResponseModel:
+    @staticmethod
+    def _copy_conversation_data(
+        cur,
+        requests: List[CustomerDataRequestModel],
+        customer_rows: List[tuple]
+    ) -> Dict[str, int]:
         """
-        Retrieves all consolidated data, now joining all 5 tables.
+        COPY path of save_conversation_data_bulk, run on the caller's cursor.
+
+        Customers are staged in a temporary table and merged with a single upsert,
+        calls are copied straight into `calls`, and the per-call tables are staged
+        by SID and resolved to call IDs with a join.
+
+        Returns:
+            The customer ID of each phone number in the batch.
         """
-        conn = None
-        try:
-            conn = self.db_client.connect()
-            if not conn:
-                raise DatabaseConnectionException(detail="Could not connect to database.")
-
-            sql_query = """
-                SELECT
-                    -- Customer columns
-                    c.customer_id,
-                    c.phone_number,
-                    c.first_name,
-                    c.customer_type,
-
-                    -- Call columns
-                    cl.call_id,
-                    cl.created_time,
-                    cl.sid,
-                    cl.call_duration,
-                    cl.artifacts,
-                    cl.live_agent_transfer,
-                    cl.abandoned,
-                    cl.elead,
-
-                    -- Vehicle columns
-                    v.vehicle_id,
-                    v.vehicle,
-                    v.model,
-                    v.requirements,
-
-                    -- Summary columns
-                    s.summary_id,
-                    s.summary,
-                    s.intent,
-                    s.resolution,
-                    s.escalation,
-                    s.next_steps,
-                    s.flags,
-                    s.tags,
-                    s.average_handle_time,
-
-                    -- Sentiment columns
-                    se.sentiment_id,
-                    se.score,
-                    se.tone_summary,
-                    se.ai_interpretation,
-                    se.emotion_breakdown,
-                    se.key_phrases,
-
-                    -- Total count window function
-                    COUNT(*) OVER() AS total_items
-                FROM calls cl
-                         JOIN
-                     customers c ON cl.customer_id = c.customer_id
-                         LEFT JOIN
-                     vehicles v ON cl.call_id = v.call_id
-                         LEFT JOIN
-                     summaries s ON cl.call_id = s.call_id
-                         LEFT JOIN
-                     sentiments se ON cl.call_id = se.call_id
-                ORDER BY cl.created_time DESC
-                    LIMIT %s
-                OFFSET %s; \
-                        """
-            logger.info(f"Fetching page {page} of conversation data ({per_page} items per page).")
-
-            # Fetch all the conversation data with pagination
-            offset = (page - 1) * per_page
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(sql_query, (per_page, offset))
-                rows = cur.fetchall()
-
-            total_items = rows[0]["total_items"] if rows else 0
-            results = []
-            for row in rows:
-                # Build CustomerDataModel
-                customer_data = CustomerDataModel(
-                    first_name=row['first_name'],
-                    phone_number=row['phone_number'],
-                    customer_type=row['customer_type']
-                )
+        cur.execute("""
+            CREATE TEMP TABLE customers_staging (
+                phone_number VARCHAR(25),
+                first_name VARCHAR(100),
+                customer_type TEXT
+            ) ON COMMIT DROP;
+
+            CREATE TEMP TABLE summaries_staging (
+                sid VARCHAR(100),
+                summary TEXT,
+                intent TEXT,
+                resolution TEXT,
+                escalation TEXT,
+                next_steps TEXT,
+                flags JSONB,
+                tags JSONB,
+                average_handle_time JSONB
+            ) ON COMMIT DROP;
 
-                # Convert call_duration (interval/timedelta) to time object
-                duration_time = self._convert_interval_to_time(row['call_duration'])
-
-                # Build CallDataModel
-                call_data = CallDataModel(
-                    created_time=row['created_time'],
-                    sid=row['sid'],
-                    duration=duration_time,
-                    artifacts=row['artifacts'] if row['artifacts'] else [],
-                    live_agent_transfer=row['live_agent_transfer'],
-                    abandoned=row['abandoned'],
-                    e_lead=row['elead']
-                )
+            CREATE TEMP TABLE sentiments_staging (
+                sid VARCHAR(100),
+                score NUMERIC(5, 2),
+                tone_summary TEXT,
+                ai_interpretation TEXT,
+                emotion_breakdown JSONB,
+                key_phrases JSONB
+            ) ON COMMIT DROP;
 
-                # Build VehicleDataModel
-                vehicle_data = VehicleDataModel(
-                    vehicle=row['vehicle'],
-                    model=row['model'],
-                    requirements=row['requirements'] if row['requirements'] else []
+            CREATE TEMP TABLE vehicles_staging (
+                sid VARCHAR(100),
+                vehicle VARCHAR(100),
+                model VARCHAR(100),
+                requirements JSONB
+            ) ON COMMIT DROP;
+        """)
+
+        # Insert/Update Customers
+        _copy_rows(cur, "customers_staging", "phone_number, first_name, customer_type", customer_rows)
+        cur.execute("""
+            INSERT INTO customers (phone_number, first_name, customer_type)
+            SELECT phone_number, first_name, customer_type::cust_type FROM customers_staging
+            ON CONFLICT (phone_number) DO UPDATE SET
+                first_name = EXCLUDED.first_name,
+                customer_type = EXCLUDED.customer_type
+            RETURNING customer_id, phone_number;
+        """)
+        customer_ids = {phone_number: customer_id for customer_id, phone_number in cur.fetchall()}
+
+        # Insert Calls
+        _copy_rows(
+            cur,
+            "calls",
+            "customer_id, created_time, sid, call_duration, artifacts, live_agent_transfer, abandoned, elead",
+            (
+                (
+                    customer_ids[request.customer_data.phone_number],
+                    request.call_data.created_time,
+                    request.call_data.sid,
+                    request.call_data.duration.isoformat(),
+                    _to_json(request.call_data.artifacts),
+                    request.call_data.live_agent_transfer,
+                    request.call_data.abandoned,
+                    request.call_data.e_lead
                 )
-
-                # Build ConversationSummaryModel
-                summary_data = ConversationSummaryModel(
-                    summary=row['summary'],
-                    intent=row['intent'],
-                    resolution=row['resolution'],
-                    escalation=row['escalation'] if row['escalation'] else "",
-                    next_steps=row['next_steps'],
-                    flags=row['flags'] if row['flags'] else [],
-                    tags=row['tags'] if row['tags'] else [],
-                    average_handle_time=row['average_handle_time'] if row['average_handle_time'] else []
+                for request in requests
+            )
+        )
+
+        # Stage Summaries, Sentiments and Vehicles by SID
+        _copy_rows(
+            cur,
+            "summaries_staging",
+            "sid, summary, intent, resolution, escalation, next_steps, flags, tags, average_handle_time",
+            (
+                (
+                    request.call_data.sid,
+                    request.summary_data.summary,
+                    request.summary_data.intent,
+                    request.summary_data.resolution,
+                    request.summary_data.escalation,
+                    request.summary_data.next_steps,
+                    _to_json(request.summary_data.flags),
+                    _to_json(request.summary_data.tags),
+                    _to_json(request.summary_data.average_handle_time)
                 )
-
-                # Build SentimentDataModel
-                sentiment_data = SentimentDataModel(
-                    score=float(row['score']),
-                    tone_summary=row['tone_summary'],
-                    ai_interpretation=row['ai_interpretation'],
-                    emotion_breakdown=row['emotion_breakdown'] if row['emotion_breakdown'] else [],
-                    key_phrases=row['key_phrases'] if row['key_phrases'] else []
+                for request in requests
+            )
+        )
+        _copy_rows(
+            cur,
+            "sentiments_staging",
+            "sid, score, tone_summary, ai_interpretation, emotion_breakdown, key_phrases",
+            (
+                (
+                    request.call_data.sid,
+                    request.sentiment_data.score,
+                    request.sentiment_data.tone_summary,
+                    request.sentiment_data.ai_interpretation,
+                    _to_json(request.sentiment_data.emotion_breakdown),
+                    _to_json(request.sentiment_data.key_phrases)
                 )
+                for request in requests
+            )
+        )
+        _copy_rows(
+            cur,
+            "vehicles_staging",
+            "sid, vehicle, model, requirements",
+            (
+                (
+                    request.call_data.sid,
+                    request.vehicle_data.vehicle,
+                    request.vehicle_data.model,
+                    _to_json(request.vehicle_data.requirements)
+                )
+                for request in requests
+                if request.vehicle_data
+            )
+        )
 
-                # Create the complete CustomerDataRequestModel
-                results.append(CustomerDataRequestModel(
-                    customer_data=customer_data,
-                    call_data=call_data,
-                    vehicle_data=vehicle_data,
-                    summary_data=summary_data,
-                    sentiment_data=sentiment_data
-                ))
-
-            logger.info(f"Successfully fetched and structured {len(results)} items for page {page}.")
-
-            total_pages = math.ceil(total_items / per_page) if total_items > 0 else 0
-
-            return CustomerDataResponseModel(
-                data=results,
-                metadata=MetadataModel(
-                    total_items=total_items,
-                    total_pages=total_pages,
-                    current_page=page,
-                    per_page=per_page
-                ),
-                status=ResponseStatus.SUCCESS
+        # Resolve call IDs from the SIDs and merge the staged rows
+        cur.execute("""
+            INSERT INTO summaries (
+                call_id, summary, intent, resolution, escalation,
+                next_steps, flags, tags, average_handle_time
             )
+            SELECT cl.call_id, st.summary, st.intent, st.resolution, st.escalation,
+                   st.next_steps, st.flags, st.tags, st.average_handle_time
+            FROM summaries_staging st
+            JOIN calls cl ON cl.sid = st.sid;
 
-        except (DatabaseConnectionException, psycopg2.Error) as e:
-            error_message = (
-                f"Database error while fetching paginated data (page={page}, per_page={per_page}): {str(e)}"
+            INSERT INTO sentiments (
+                call_id, score, tone_summary, ai_interpretation, emotion_breakdown, key_phrases
             )
-            logger.error(error_message)
-            raise DatabaseConnectionException(detail=error_message)
+            SELECT cl.call_id, st.score, st.tone_summary, st.ai_interpretation,
+                   st.emotion_breakdown, st.key_phrases
+            FROM sentiments_staging st
+            JOIN calls cl ON cl.sid = st.sid;
 
-        except Exception as e:
-            logger.error(f"An unexpected error occurred during paginated data retrieval: {str(e)}")
-            raise
+            INSERT INTO vehicles (call_id, vehicle, model, requirements)
+            SELECT cl.call_id, st.vehicle, st.model, st.requirements
+            FROM vehicles_staging st
+            JOIN calls cl ON cl.sid = st.sid;
+
+            -- Drop them now rather than at commit
+            DROP TABLE customers_staging, summaries_staging, sentiments_staging, vehicles_staging;
+        """)
+
+        return customer_ids
 
-        finally:
-            if conn:
-                conn.close()
+    @db_errors("stream_conversation_data")
+    def stream_conversation_data(self) -> Iterator[dict]:
+        """
+        Streams every conversation, newest first, as payload dicts in the
+        CustomerDataRequestModel layout.
 
+        Rows are read through a server-side cursor, STREAM_ITERSIZE at a time,
+        and the pooled connection is held until the generator is exhausted or closed.
+        """
+        sql_query = f"""
+            SELECT {CONVERSATION_PAYLOAD_SQL} AS payload
+            FROM calls cl
+                 {CONVERSATION_JOINS_SQL}
+            ORDER BY cl.created_time DESC, cl.call_id DESC;
+        """
+        logger.info("Streaming conversation data.")
+
+        with self.db_client.acquire() as conn, conn, conn.cursor(name="conv_read") as cur:
+            cur.itersize = STREAM_ITERSIZE
+            cur.execute(sql_query)
+
+            count = 0
+            for (payload,) in cur:
+                count += 1
+                yield payload
+
+        logger.info("Successfully streamed %d conversations.", count)
+
+    @db_errors("get_conversation_data")
+    def get_conversation_data(
+        self,
+        page: int,
+        per_page: int,
+        cursor: Optional[str] = None
+    ) -> CustomerDataResponseModel:
+        """
+        Retrieves all consolidated data, now joining all 5 tables.
+        Each row is shaped into the CustomerDataRequestModel layout by Postgres,
+        so Python only validates one JSON document per call.
 
-conversation_service = ConversationService()
\ No newline at end of file
+        Pages are ordered by (created_time, call_id). When `cursor` (the
+        `next_cursor` of a previous page) is given, the page starts right after
+        that call through the idx_calls_created_id index instead of skipping
+        `(page - 1) * per_page` rows with OFFSET.
+        """
+        if cursor:
+            page_filter = "WHERE (cl.created_time, cl.call_id) < (%s, %s)"
+            page_clause = "LIMIT %s"
+            params = (*_decode_cursor(cursor), per_page)
+        else:
+            page_filter = ""
+            page_clause = "LIMIT %s OFFSET %s"
+            params = (per_page, (page - 1) * per_page)
+
+        sql_query = f"""
+            SELECT
+                {CONVERSATION_PAYLOAD_SQL} AS payload,
+
+                -- Keyset position of the row
+                cl.created_time,
+                cl.call_id
+            FROM (
+                -- Page through calls alone, so only the page's calls are joined. Only
+                -- the idx_calls_created_id key columns are read, allowing an index-only scan.
+                SELECT cl.call_id
+                FROM calls cl
+                {page_filter}
+                ORDER BY cl.created_time DESC, cl.call_id DESC
+                {page_clause}
+            ) page
+                     JOIN
+                 calls cl ON cl.call_id = page.call_id
+                 {CONVERSATION_JOINS_SQL}
+            ORDER BY cl.created_time DESC, cl.call_id DESC; \
+                    """
+        logger.info("Fetching page %d of conversation data (%d items per page).", page, per_page)
+
+        # Fetch the page, and count the calls separately so the page query can stop at its LIMIT.
+        # The count is cached for TOTAL_ITEMS_CACHE_TTL seconds and dropped when calls are saved.
+        # Past TOTAL_ITEMS_ESTIMATE_THRESHOLD calls the planner's row estimate is used instead.
+        total_items = self._total_items_cache.get("calls")
+        with self.db_client.acquire() as conn, conn, conn.cursor() as cur:
+            cur.execute(sql_query, params)
+            rows = cur.fetchall()
+
+            if total_items is MISSING:
+                cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = 'calls'::regclass;")
+                total_items = cur.fetchone()[0]
+                # reltuples is -1 until the table is first vacuumed or analyzed
+                if total_items < TOTAL_ITEMS_ESTIMATE_THRESHOLD:
+                    cur.execute("SELECT COUNT(*) FROM calls;")
+                    total_items = cur.fetchone()[0]
+                self._total_items_cache.set("calls", total_items)
+
+        results = _CONVERSATIONS_ADAPTER.validate_python([payload for payload, _, _ in rows])
+
+        # A full page may have more calls after it
+        next_cursor = _encode_cursor(*rows[-1][1:]) if rows and len(rows) == per_page else None
+
+        logger.info("Successfully fetched and structured %d items for page %d.", len(results), page)
+
+        # per_page >= 1 is enforced by the router; the total no longer comes from the
+        # page rows, so it can be positive even for an empty page
+        total_pages = math.ceil(total_items / per_page)
+
+        return CustomerDataResponseModel(
+            data=results,
+            metadata=MetadataModel(
+                total_items=total_items,
+                total_pages=total_pages,
+                current_page=page,
+                per_page=per_page,
+                next_cursor=next_cursor
+            ),
+            status=ResponseStatus.SUCCESS
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_conversation_service() -> ConversationService:
+    """
+    Return the shared ConversationService, creating it (and its schema) on first use
+    instead of at import time. main.py calls it at startup, since contact lookups
+    also read the conversation tables.
+    """
+    return ConversationService()
\ No newline at end of file
@@ -1,56 +1,155 @@
+import orjson
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import List, Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from psycopg2.extensions import connection as Connection, cursor as Cursor
+from psycopg2.extras import RealDictCursor, register_default_jsonb
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from typing import List, Dict, Any, Optional, Sequence
 import os
-from config import DB_HOST, DB_NAME, DB_USER, DB_PASSWORD, DB_PORT
+from app.exceptions.database.database_connection_exception import DatabaseConnectionException
+from config import (
+    DB_HOST, DB_NAME, DB_USER, DB_PASSWORD, DB_PORT, DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, DB_POOL_TIMEOUT
+)
+
+
+# Decode JSONB results with orjson on every connection
+register_default_jsonb(globally=True, loads=orjson.loads)
+
+
+class PreparingConnection(Connection):
+    """Connection remembering which server-side prepared statements it holds"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
+def execute_prepared(cur: Cursor, name: str, sql: str, params: Sequence[Any] = ()):
+    """
+    Execute `sql` through the server-side prepared statement `name`.
+
+    The statement is prepared the first time it is used on a connection and
+    reused for every later call on it, skipping the parse/plan step.
+    `sql` uses positional `$1..$n` placeholders.
+    """
+    conn = cur.connection
+    if name not in conn.prepared_statements:
+        # Prepared statements outlive the transaction, so this runs once per connection
+        cur.execute(f"PREPARE {name} AS {sql}")
+        conn.prepared_statements.add(name)
+
+    if params:
+        placeholders = ', '.join(['%s'] * len(params))
+        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
 
 
 class PostgresClient:
+    # Connection pool shared by every client in the process
+    _pool: Optional[ThreadedConnectionPool] = None
+    _pool_lock = threading.Lock()
+    # ThreadedConnectionPool raises instead of waiting when it is exhausted, so
+    # checkouts first wait for one of these slots
+    _pool_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONN)
+
     def __init__(self):
         self.host = DB_HOST
         self.database = DB_NAME
         self.user = DB_USER
         self.password = DB_PASSWORD
         self.port = DB_PORT
-        self.conn = None
-    
-    def connect(self):
-        """Establish database connection"""
-        try:
-            self.conn = psycopg2.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password,
-                port=self.port
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Create the shared connection pool on first use"""
+        if PostgresClient._pool is None:
+            with PostgresClient._pool_lock:
+                if PostgresClient._pool is None:
+                    PostgresClient._pool = ThreadedConnectionPool(
+                        minconn=DB_POOL_MIN_CONN,
+                        maxconn=DB_POOL_MAX_CONN,
+                        host=self.host,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password,
+                        port=self.port,
+                        connection_factory=PreparingConnection
+                    )
+        return PostgresClient._pool
+
+    def getconn(self) -> Connection:
+        """
+        Borrow a pooled connection, waiting up to DB_POOL_TIMEOUT seconds for one
+        to be returned when all of them are in use. Give it back with putconn.
+
+        Raises:
+            DatabaseConnectionException: No connection freed up in time, or the
+                database could not be reached
+        """
+        if not PostgresClient._pool_slots.acquire(timeout=DB_POOL_TIMEOUT):
+            raise DatabaseConnectionException(
+                detail=f"No database connection became available within {DB_POOL_TIMEOUT} seconds."
             )
-            return self.conn
+
+        try:
+            # Creating the pool or a new pooled connection fails with OperationalError when the DB is down
+            return self._get_pool().getconn()
         except Exception as e:
-            print(f"Error connecting to database: {e}")
+            PostgresClient._pool_slots.release()
+            if isinstance(e, (PoolError, psycopg2.Error)):
+                raise DatabaseConnectionException(detail=f"Could not get a database connection: {e}") from e
             raise
-    
-    def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-    
-    def create(self, table: str, data: Dict[str, Any]) -> Optional[int]:
+
+    def putconn(self, conn: Connection):
+        """Return a connection borrowed with getconn"""
+        try:
+            # The pool rolls back unfinished transactions and drops broken connections
+            self._get_pool().putconn(conn)
+        finally:
+            PostgresClient._pool_slots.release()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a pooled connection that is returned when the block exits"""
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    @contextmanager
+    def transaction(self, conn: Optional[Connection] = None):
+        """
+        Run a block inside a transaction.
+
+        Without `conn` a pooled connection is borrowed and committed (or rolled
+        back) when the block exits. When the caller passes its own `conn`, the
+        block joins that transaction and leaves commit/rollback to the caller.
+        """
+        if conn is not None:
+            yield conn
+            return
+
+        with self.acquire() as conn, conn:
+            yield conn
+
+    def create(self, table: str, data: Dict[str, Any], conn: Optional[Connection] = None) -> Optional[int]:
         """Insert a record"""
         cols = ', '.join(data.keys())
         vals = ', '.join(['%s'] * len(data))
         query = f"INSERT INTO {table} ({cols}) VALUES ({vals}) RETURNING id"
         
         try:
-            with self.conn.cursor() as cur:
+            with self.transaction(conn) as conn, conn.cursor() as cur:
                 cur.execute(query, list(data.values()))
-                self.conn.commit()
                 return cur.fetchone()[0]
         except Exception as e:
-            self.conn.rollback()
             print(f"Error creating record: {e}")
             return None
     
-    def read(self, table: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    def read(self, table: str, filters: Optional[Dict[str, Any]] = None,
+             conn: Optional[Connection] = None) -> List[Dict]:
         """Read records with optional filters"""
         query = f"SELECT * FROM {table}"
         params = []
@@ -61,40 +160,37 @@ class PostgresClient:
             params = list(filters.values())
         
         try:
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            with self.transaction(conn) as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, params)
                 return [dict(row) for row in cur.fetchall()]
         except Exception as e:
             print(f"Error reading records: {e}")
             return []
     
-    def update(self, table: str, data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    def update(self, table: str, data: Dict[str, Any], filters: Dict[str, Any],
+               conn: Optional[Connection] = None) -> bool:
         """Update records"""
         set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
         where_clause = ' AND '.join([f"{k} = %s" for k in filters.keys()])
         query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
         
         try:
-            with self.conn.cursor() as cur:
+            with self.transaction(conn) as conn, conn.cursor() as cur:
                 cur.execute(query, list(data.values()) + list(filters.values()))
-                self.conn.commit()
                 return cur.rowcount > 0
         except Exception as e:
-            self.conn.rollback()
             print(f"Error updating record: {e}")
             return False
     
-    def delete(self, table: str, filters: Dict[str, Any]) -> bool:
+    def delete(self, table: str, filters: Dict[str, Any], conn: Optional[Connection] = None) -> bool:
         """Delete records"""
         where_clause = ' AND '.join([f"{k} = %s" for k in filters.keys()])
         query = f"DELETE FROM {table} WHERE {where_clause}"
         
         try:
-            with self.conn.cursor() as cur:
+            with self.transaction(conn) as conn, conn.cursor() as cur:
                 cur.execute(query, list(filters.values()))
-                self.conn.commit()
                 return cur.rowcount > 0
         except Exception as e:
-            self.conn.rollback()
             print(f"Error deleting record: {e}")
-            return False
\ No newline at end of file
+            return False
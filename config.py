@@ -199,6 +199,14 @@ DB_NAME = os.getenv("DB_NAME", "voice-demo")
 DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "Lahiru1997")
 DB_PORT = os.getenv("DB_PORT", "5432")
+DB_POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN_CONN", 2))
+# Also caps the threadpool running sync handlers (see main.py), so that every
+# worker thread can hold a connection; 40 is the AnyIO threadpool default
+DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", 40))
+# Seconds a request waits for a free pooled connection before failing
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+# Create the conversation, contact and appointment tables when the services start
+DB_INIT_SCHEMA = os.getenv("DB_INIT_SCHEMA", "True").lower() == "true"
 INGESTION_TEMPLATE = os.getenv("INGESTION_TEMPLATE", INGESTION_TEMPLATE_ONE)
 COHERE_API_KEY = os.getenv("COHERE_API_KEY")
 SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
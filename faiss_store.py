@@ -10,11 +10,27 @@ from langchain_openai import OpenAIEmbeddings
 
 from config import EMBEDDING_MODEL
 
+# Output dimension of known OpenAI embedding models, so no request is needed to find it
+_MODEL_DIMS = {
+    "text-embedding-3-large": 3072,
+    "text-embedding-3-small": 1536,
+    "text-embedding-ada-002": 1536,
+}
+
+# HNSW graph parameters: neighbors per node, and candidate list sizes while building and searching
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+
 
 class Faiss:
     def __init__(self):
         self.embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
-        self.index = faiss.IndexFlatL2(len(self.embeddings.embed_query("faiss store")))
+        dim = _MODEL_DIMS.get(EMBEDDING_MODEL) or len(self.embeddings.embed_query("faiss store"))
+        # HNSW graph search is sublinear in the number of vectors, at a small recall cost
+        self.index = faiss.IndexHNSWFlat(dim, HNSW_NEIGHBORS)
+        self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        self.index.hnsw.efSearch = HNSW_EF_SEARCH
         self.vector_store = FAISS(
             embedding_function=self.embeddings,
             index=self.index,
@@ -7,14 +7,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from contextlib import asynccontextmanager
+
 import uvicorn
+from anyio.to_thread import current_default_thread_limiter
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import api_router
-from config import HOST, PORT
+from app.services.contact_service import get_contact_service
+from app.services.conversation_service import get_conversation_service
+from config import DB_POOL_MAX_CONN, HOST, PORT
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One worker thread per pooled connection, so sync handlers never outnumber them
+    current_default_thread_limiter().total_tokens = DB_POOL_MAX_CONN
+
+    # Build the services, and with them the schema, before serving requests.
+    # Contact lookups read the conversation tables, so those must exist first.
+    await run_in_threadpool(get_conversation_service)
+    await run_in_threadpool(get_contact_service)
+    yield
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(